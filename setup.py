@@ -1,31 +1,42 @@
 """Project setup"""
 import pathlib
-import xml.etree.ElementTree as ET
 import setuptools
 
-root_path: pathlib.Path = pathlib.Path(__file__).parent
+try:
+    from lxml import etree as ET
+except ImportError:
+    import xml.etree.ElementTree as ET
 
-with open(pathlib.Path(root_path, "README.md"), "r", encoding="utf-8") as fh:
-    long_description = fh.read()
+root_path: pathlib.Path = pathlib.Path(__file__).parent
 
-with open(pathlib.Path(root_path, "requirements.txt"), "r", encoding="utf-8") as req_file:
-    install_requires = req_file.read().splitlines()
+long_description = (root_path / "README.md").read_bytes().decode("utf-8")
+install_requires = (root_path / "requirements.txt").read_bytes().decode("utf-8").splitlines()
 
 def _read_project_xml_metadata(project_xml_path: pathlib.Path) -> tuple[str, str]:
-    tree = ET.parse(project_xml_path)
-    root = tree.getroot()
+    # Only <name> and <version> are needed, so stream the file and stop as soon
+    # as both top-level fields have been seen instead of building the full tree.
+    found: dict[str, str] = {}
+    depth = 0
+    for event, element in ET.iterparse(str(project_xml_path), events=("start", "end")):
+        if event == "start":
+            depth += 1
+            continue
+        depth -= 1
+        if depth == 1 and element.tag in ("name", "version"):
+            found.setdefault(element.tag, (element.text or "").strip())
+            if len(found) == 2:
+                break
+        element.clear()
 
-    name_node = root.find("name")
-    version_node = root.find("version")
-    if name_node is None or not (name_node.text or "").strip():
+    if not found.get("name"):
         raise ValueError("Missing <name> in project.xml")
-    if version_node is None or not (version_node.text or "").strip():
+    if not found.get("version"):
         raise ValueError("Missing <version> in project.xml")
 
-    return name_node.text.strip(), version_node.text.strip()
+    return found["name"], found["version"]
 
 
-name, version = _read_project_xml_metadata(pathlib.Path(root_path, "project.xml"))
+name, version = _read_project_xml_metadata(root_path / "project.xml")
 
 setuptools.setup(
     name=name,
@@ -2,7 +2,7 @@
 
 import logging
 from enum import Enum
-from typing import List
+from typing import Iterable, List
 
 
 class LogLevel(Enum):
@@ -14,13 +14,22 @@ class LogLevel(Enum):
     debug = 10,
 
 
-def log_list(logs_list: List[str], level: LogLevel = LogLevel.info):
+def log_list(logs_list: Iterable[str], level: LogLevel = LogLevel.info, single_record: bool = False):
     """Logs a list using the specified level.
 
     Args:
-        logs_list: List of strings to be logged.
+        logs_list: List (or any iterable) of strings to be logged.
         level: Logging level.
+        single_record: If True, the strings are logged as one record, one per
+            line, and only iterated if the level is enabled.
     """
+    if single_record:
+        if logging.getLogger().isEnabledFor(level.value[0]):
+            message = "\n".join(logs_list)
+            if message:
+                logging.log(level.value[0], message)
+        return
+
     if logs_list:
         for log in logs_list:
             logging.log(level.value[0], log)
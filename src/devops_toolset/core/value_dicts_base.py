@@ -22,9 +22,10 @@ class ValueDictsBase(object):
                 _external = values()
                 self._all_dictionaries += _external.get_dicts()
 
+        # Values are converted to str once here, so get() is a plain dict lookup
         self.all = {}
         for dictionary in self._all_dictionaries:
-            self.all.update(dictionary[1])
+            self.all.update((key, str(value)) for key, value in dictionary[1].items())
 
     def get(self, key: str) -> str:
         """Gets a literal from a given key.
@@ -33,7 +34,7 @@ class ValueDictsBase(object):
             key: used for getting the value
         """
 
-        return str(self.all[key])
+        return self.all[key]
 
     def get_dicts(self):
         """Gets all dict objects of the class."""
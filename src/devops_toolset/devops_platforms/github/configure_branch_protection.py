@@ -6,7 +6,7 @@ This script automates the setup of branch protection rules for main and develop
 ensuring PR-based workflow with proper reviews and status checks.
 
 Requirements:
-    pip install PyGithub
+    pip install requests
 
 Usage:
     python configure-branch-protection.py --token YOUR_GITHUB_TOKEN
@@ -20,17 +20,136 @@ GitHub Token Permissions Required:
 """
 
 import argparse
+import json
 import os
+import pathlib
 import sys
-from github import Github, GithubException
+from typing import TYPE_CHECKING, Optional
 
+if TYPE_CHECKING:
+    import requests
 
-def configure_branch_protection(repo, branch_name, strict=True):
+
+GITHUB_API_URL = "https://api.github.com"
+GITHUB_API_VERSION = "2022-11-28"
+ETAG_CACHE_PATH = pathlib.Path.home() / ".cache" / "devops-toolset" / "gh-etags.json"
+
+# (label, key) pairs for the {"enabled": bool} flags in the protection payload
+RESTRICTION_FLAGS = (
+    ("Enforce for admins", "enforce_admins"),
+    ("Allow force pushes", "allow_force_pushes"),
+    ("Allow deletions", "allow_deletions"),
+)
+
+
+def load_etag_cache() -> dict:
+    """Load the ETag -> payload cache used for conditional GitHub requests."""
+    try:
+        return json.loads(ETAG_CACHE_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def save_etag_cache(cache: dict):
+    """Persist the ETag -> payload cache (best effort)."""
+    try:
+        ETAG_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        ETAG_CACHE_PATH.write_text(json.dumps(cache), encoding="utf-8")
+    except OSError:
+        pass
+
+
+def create_session(token) -> "requests.Session":
+    """Create an authenticated session for the GitHub REST API."""
+    # Imported here so --help and argument errors don't pay for loading requests
+    import requests
+    
+    session = requests.Session()
+    session.headers.update({
+        "Authorization": f"Bearer {token}",
+        "Accept": "application/vnd.github+json",
+        "X-GitHub-Api-Version": GITHUB_API_VERSION,
+    })
+    return session
+
+
+def get_error_message(response) -> str:
+    """Get the error message from a GitHub API error response."""
+    try:
+        return response.json().get("message", response.reason)
+    except ValueError:
+        return response.reason
+
+
+def get_branch_protection(session, repo_name, branch_name) -> Optional[dict]:
+    """
+    Get the raw branch protection JSON using a conditional request.
+    
+    The last ETag and payload are stored on disk, so repeated runs get a
+    304 Not Modified response, which does not count against the rate limit.
+    
+    Returns:
+        Protection payload, or None if the branch is not protected.
+    """
+    cache = load_etag_cache()
+    cache_key = f"{repo_name}/{branch_name}"
+    cached = cache.get(cache_key)
+    
+    headers = {"If-None-Match": cached["etag"]} if cached else None
+    url = f"{GITHUB_API_URL}/repos/{repo_name}/branches/{branch_name}/protection"
+    response = session.get(url, headers=headers)
+    if cached and response.status_code == 304:
+        return cached["data"]
+    if response.status_code == 404:
+        return None
+    response.raise_for_status()
+    
+    data = response.json()
+    etag = response.headers.get("ETag")
+    if etag:
+        cache[cache_key] = {"etag": etag, "data": data}
+        save_etag_cache(cache)
+    return data
+
+
+def is_protection_up_to_date(current, desired) -> bool:
+    """
+    Check if the current protection payload (GET format) already matches the
+    desired protection body (PUT format).
+    
+    In the GET payload, boolean settings are wrapped as {"enabled": bool}
+    and unset sections are omitted. List values are compared ignoring order.
+    """
+    for key, value in desired.items():
+        current_value = current.get(key)
+        if value is None:
+            if current_value:
+                return False
+        elif isinstance(value, bool):
+            if (current_value or {}).get("enabled", False) != value:
+                return False
+        elif isinstance(value, dict):
+            if not current_value:
+                return False
+            for sub_key, sub_value in value.items():
+                current_sub_value = current_value.get(sub_key)
+                if isinstance(sub_value, list):
+                    if sorted(current_sub_value or []) != sorted(sub_value):
+                        return False
+                elif current_sub_value != sub_value:
+                    return False
+        elif current_value != value:
+            return False
+    return True
+
+
+def configure_branch_protection(session, repo_name, branch_name, strict=True):
     """
     Configure branch protection rules.
     
     Args:
-        repo: GitHub repository object
+        session: Authenticated GitHub API session
+        repo_name: Repository in format 'owner/repo'
         branch_name: Name of the branch to protect
         strict: If True, enforces strict rules for production branches (main).
                 If False, allows more flexibility for development branches.
@@ -45,104 +164,130 @@ def configure_branch_protection(repo, branch_name, strict=True):
         - Admins can bypass for emergencies
         - No linear history requirement
         - More flexible status checks
+    
+    Returns:
+        Tuple (success, protection) where protection is the raw protection
+        payload after the update (or the current one if it was already
+        up to date), or None if nothing was configured.
     """
+    from requests.exceptions import HTTPError
+    
     icon = "🔒" if strict else "🔓"
     mode = "strict" if strict else "flexible"
     print(f"\n{icon} Configuring {mode} branch protection for '{branch_name}'...")
     
-    try:
-        # Check if branch exists
-        try:
-            branch = repo.get_branch(branch_name)
-        except GithubException as e:
-            if e.status == 404:
-                print(f"⚠️  Branch '{branch_name}' does not exist yet. Skipping configuration.")
-                print(f"   Run this script again after creating the {branch_name} branch.")
-                return True
-            raise
-        
-        # Configure protection with conditional parameters
-        protection_args = {
-            # Pull request reviews (always required)
+    # Protection body, see PUT /repos/{owner}/{repo}/branches/{branch}/protection
+    protection_body = {
+        # Pull request reviews (always required)
+        "required_pull_request_reviews": {
             "required_approving_review_count": 1,
             "dismiss_stale_reviews": True,
             "require_code_owner_reviews": False,  # Set to True if you have CODEOWNERS
-            
-            # Status checks
+        },
+        
+        # Status checks
+        "required_status_checks": {
             "strict": strict,  # Strict: require branches up to date
             "contexts": ["SonarCloud"],  # Required status checks
-            
-            # Restrictions (always block force pushes and deletions)
-            "allow_force_pushes": False,
-            "allow_deletions": False,
-            
-            # Admin enforcement (strict mode only)
-            "enforce_admins": strict,
-        }
-        
-        # Add strict-only parameters
-        if strict:
-            protection_args["require_conversation_resolution"] = True
-            protection_args["require_linear_history"] = True
-        
-        branch.edit_protection(**protection_args)
-        
-        # Success message
-        print(f"✅ Branch protection configured for '{branch_name}'")
-        print(f"   - Requires 1 approval")
-        print(f"   - Dismisses stale reviews")
-        
-        if strict:
-            print(f"   - Requires conversation resolution")
-            print(f"   - Linear history enforced")
-            print(f"   - Admins cannot bypass")
-        else:
-            print(f"   - Admins can bypass (for emergencies)")
-        
-        print(f"   - Force pushes blocked")
-        print(f"   - Deletions blocked")
+        },
         
-        return True
+        # Restrictions (always block force pushes and deletions)
+        "restrictions": None,
+        "allow_force_pushes": False,
+        "allow_deletions": False,
         
-    except GithubException as e:
-        print(f"❌ Failed to configure {branch_name} branch: {e.data.get('message', str(e))}")
-        return False
+        # Strict mode only
+        "enforce_admins": strict,
+        "required_conversation_resolution": strict,
+        "required_linear_history": strict,
+    }
+    
+    # Skip the update if nothing would change (conditional GET, usually a 304)
+    try:
+        current_protection = get_branch_protection(session, repo_name, branch_name)
+    except HTTPError:
+        current_protection = None
+    if current_protection and is_protection_up_to_date(current_protection, protection_body):
+        print(f"✅ Branch protection for '{branch_name}' is up to date, skipping")
+        return True, current_protection
+    
+    url = f"{GITHUB_API_URL}/repos/{repo_name}/branches/{branch_name}/protection"
+    response = session.put(url, json=protection_body)
+    
+    # Branch does not exist
+    if response.status_code == 404:
+        print(f"⚠️  Branch '{branch_name}' does not exist yet. Skipping configuration.")
+        print(f"   Run this script again after creating the {branch_name} branch.")
+        return True, None
+    
+    if not response.ok:
+        print(f"❌ Failed to configure {branch_name} branch: {get_error_message(response)}")
+        return False, None
+    
+    # Success message
+    print(f"✅ Branch protection configured for '{branch_name}'")
+    print(f"   - Requires 1 approval")
+    print(f"   - Dismisses stale reviews")
+    
+    if strict:
+        print(f"   - Requires conversation resolution")
+        print(f"   - Linear history enforced")
+        print(f"   - Admins cannot bypass")
+    else:
+        print(f"   - Admins can bypass (for emergencies)")
+    
+    print(f"   - Force pushes blocked")
+    print(f"   - Deletions blocked")
+    
+    return True, response.json()
 
 
-def verify_branch_protection(repo, branch_name):
-    """Verify and display current branch protection settings."""
+def verify_branch_protection(session, repo_name, branch_name, protection=None):
+    """
+    Verify and display current branch protection settings.
+    
+    Args:
+        session: Authenticated GitHub API session
+        repo_name: Repository in format 'owner/repo'
+        branch_name: Name of the branch to verify
+        protection: Raw protection payload already returned by GitHub for this branch.
+                    If None, it is fetched from the API.
+    """
+    from requests.exceptions import HTTPError
+    
     print(f"\n📋 Current protection rules for '{branch_name}':")
     
     try:
-        branch = repo.get_branch(branch_name)
-        protection = branch.get_protection()
+        if protection is None:
+            protection = get_branch_protection(session, repo_name, branch_name)
+        if protection is None:
+            print(f"   ⚠️  No protection rules configured")
+            return False
         
         # Pull Request settings
-        if protection.required_pull_request_reviews:
-            reviews = protection.required_pull_request_reviews
-            print(f"   ✓ Required approvals: {reviews.required_approving_review_count}")
-            print(f"   ✓ Dismiss stale reviews: {reviews.dismiss_stale_reviews}")
-            print(f"   ✓ Code owner reviews: {reviews.require_code_owner_reviews}")
+        reviews = protection.get("required_pull_request_reviews")
+        if reviews:
+            print(f"   ✓ Required approvals: {reviews.get('required_approving_review_count')}")
+            print(f"   ✓ Dismiss stale reviews: {reviews.get('dismiss_stale_reviews')}")
+            print(f"   ✓ Code owner reviews: {reviews.get('require_code_owner_reviews')}")
         
         # Status checks
-        if protection.required_status_checks:
-            checks = protection.required_status_checks
-            print(f"   ✓ Strict status checks: {checks.strict}")
-            if checks.contexts:
-                print(f"   ✓ Required checks: {', '.join(checks.contexts)}")
+        checks = protection.get("required_status_checks")
+        if checks:
+            print(f"   ✓ Strict status checks: {checks.get('strict')}")
+            contexts = checks.get("contexts")
+            if contexts:
+                print(f"   ✓ Required checks: {', '.join(contexts)}")
         
         # Restrictions
-        print(f"   ✓ Enforce for admins: {protection.enforce_admins.enabled}")
-        print(f"   ✓ Allow force pushes: {protection.allow_force_pushes.enabled}")
-        print(f"   ✓ Allow deletions: {protection.allow_deletions.enabled}")
+        for label, key in RESTRICTION_FLAGS:
+            flag = protection.get(key) or {}
+            print(f"   ✓ {label}: {flag.get('enabled', False)}")
         
         return True
         
-    except GithubException as e:
-        if e.status == 404:
-            print(f"   ⚠️  No protection rules configured")
-        else:
-            print(f"   ❌ Error: {e.data.get('message', str(e))}")
+    except HTTPError as e:
+        print(f"   ❌ Error: {get_error_message(e.response)}")
         return False
 
 
@@ -190,37 +335,38 @@ def main():
     print(f"\nRepository: {args.repo}")
     
     # Initialize GitHub client
-    try:
-        gh = Github(args.token)
-        repo = gh.get_repo(args.repo)
-        print(f"✓ Connected to repository: {repo.full_name}")
-    except GithubException as e:
-        print(f"❌ Failed to connect to GitHub: {e.data.get('message', str(e))}")
+    session = create_session(args.token)
+    response = session.get(f"{GITHUB_API_URL}/repos/{args.repo}")
+    if not response.ok:
+        print(f"❌ Failed to connect to GitHub: {get_error_message(response)}")
         sys.exit(1)
+    print(f"✓ Connected to repository: {response.json()['full_name']}")
     
     # Verify only mode
     if args.verify_only:
         print("\n📊 Verification Mode - Current Settings:")
-        verify_branch_protection(repo, "main")
+        verify_branch_protection(session, args.repo, "main")
         if not args.skip_develop:
-            verify_branch_protection(repo, "develop")
+            verify_branch_protection(session, args.repo, "develop")
         sys.exit(0)
     
     # Configure branch protections
     success = True
     
     # Configure main branch (strict mode)
-    if not configure_branch_protection(repo, "main", strict=True):
+    configured, protection = configure_branch_protection(session, args.repo, "main", strict=True)
+    if not configured:
         success = False
     else:
-        verify_branch_protection(repo, "main")
+        verify_branch_protection(session, args.repo, "main", protection)
     
     # Configure develop branch (flexible mode)
     if not args.skip_develop:
-        if not configure_branch_protection(repo, "develop", strict=False):
+        configured, protection = configure_branch_protection(session, args.repo, "develop", strict=False)
+        if not configured:
             success = False
         else:
-            verify_branch_protection(repo, "develop")
+            verify_branch_protection(session, args.repo, "develop", protection)
     
     # Summary
     print("\n" + "=" * 60)
@@ -6,10 +6,11 @@ This script checks the status of workspaces and their latest runs.
 """
 
 import argparse
+import collections
 import os
 import sys
-from typing import Dict, List, Optional
-import requests
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 import time
 from datetime import datetime
 
@@ -17,6 +18,51 @@ from datetime import datetime
 # Configuration
 ORGANIZATION = "aheadlabs"
 API_BASE_URL = "https://app.terraform.io/api/v2"
+MAX_WORKERS = 16
+POLL_INTERVAL_MIN = 2
+POLL_INTERVAL_MAX = 30
+POLL_BACKOFF_FACTOR = 1.5
+PLAN_LOG_TAIL_LINES = 10
+
+DEFAULT_WORKSPACES = (
+    "aheadlabs-com-production",
+    "aheadlabs-com-staging",
+    "ai-assistant-production",
+    "ai-assistant-staging",
+    "apps-aheadlabs-com-production",
+    "apps-aheadlabs-com-staging",
+    "automations-production",
+    "automations-staging",
+    "campus-aheadlabs-com-production",
+    "campus-aheadlabs-com-staging",
+    "core-infrastructure-production",
+    "core-infrastructure-shared",
+    "core-infrastructure-staging",
+    "ladichosa-es-production",
+    "ladichosa-es-staging",
+    "monitoring-production",
+    "monitoring-staging",
+    "services-aheadlabs-com-production",
+    "services-aheadlabs-com-staging",
+    "signatus-production",
+    "signatus-staging",
+)
+
+RUN_STATUS_ICONS = {
+    "planned": "📋",
+    "planning": "⏳",
+    "applied": "✅",
+    "applying": "⚙️",
+    "errored": "❌",
+    "canceled": "⏹️",
+    "pending": "⏸️"
+}
+COMPLETED_STATUS_ICONS = {
+    "applied": "✅",
+    "errored": "❌",
+    "canceled": "⏹️",
+    "discarded": "🗑️"
+}
 
 
 class TerraformCloudAPI:
@@ -28,39 +74,93 @@ class TerraformCloudAPI:
             "Authorization": f"Bearer {token}",
             "Content-Type": "application/vnd.api+json",
         }
+        # Imported here so --help and argument errors don't pay for loading requests
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util import Retry
+        
+        # Shared session so every call (and every worker thread) reuses pooled keep-alive connections
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=MAX_WORKERS * 2,
+            pool_maxsize=MAX_WORKERS * 2,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 502, 503, 504],
+                raise_on_status=False,
+            ),
+        )
+        self.session.mount("https://", adapter)
+        # run_id -> (ETag, run data) so polling can use conditional requests
+        self._run_cache: Dict[str, Tuple[str, dict]] = {}
+        
+        # Endpoint URLs only depend on configuration, build them once
+        self._workspaces_url = f"{API_BASE_URL}/organizations/{ORGANIZATION}/workspaces"
+        self._workspaces_prefix = f"{self._workspaces_url}/"
+        self._runs_url = f"{API_BASE_URL}/runs"
+        self._runs_prefix = f"{self._runs_url}/"
+        self._plans_prefix = f"{API_BASE_URL}/plans/"
+    
+    def list_workspaces(self) -> Dict[str, dict]:
+        """Get all workspaces in the organization, indexed by name"""
+        url = self._workspaces_url
+        workspaces = {}
+        page = 1
+        while page:
+            response = self.session.get(url, params={"page[size]": 100, "page[number]": page})
+            response.raise_for_status()
+            data = response.json()
+            for workspace in data["data"]:
+                workspaces[workspace["attributes"]["name"]] = workspace
+            page = data.get("meta", {}).get("pagination", {}).get("next-page")
+        return workspaces
     
     def get_workspace(self, workspace_name: str) -> Optional[dict]:
         """Get workspace information"""
-        url = f"{API_BASE_URL}/organizations/{ORGANIZATION}/workspaces/{workspace_name}"
-        try:
-            response = requests.get(url, headers=self.headers)
-            response.raise_for_status()
-            return response.json()["data"]
-        except requests.exceptions.HTTPError:
+        url = self._workspaces_prefix + workspace_name
+        response = self.session.get(url)
+        if not response.ok:
             return None
+        return response.json()["data"]
     
     def get_run_status(self, run_id: str) -> dict:
         """Get run status and details"""
-        url = f"{API_BASE_URL}/runs/{run_id}"
-        response = requests.get(url, headers=self.headers)
+        url = self._runs_prefix + run_id
+        cached = self._run_cache.get(run_id)
+        headers = {"If-None-Match": cached[0]} if cached else None
+        response = self.session.get(url, headers=headers)
+        if cached and response.status_code == 304:
+            return cached[1]
         response.raise_for_status()
-        return response.json()["data"]
+        
+        data = response.json()["data"]
+        etag = response.headers.get("ETag")
+        if etag:
+            self._run_cache[run_id] = (etag, data)
+        return data
     
-    def get_plan_logs(self, plan_id: str) -> str:
-        """Get plan logs"""
-        url = f"{API_BASE_URL}/plans/{plan_id}"
-        response = requests.get(url, headers=self.headers)
+    def get_plan_logs(self, plan_id: str, tail_lines: int = PLAN_LOG_TAIL_LINES) -> str:
+        """Get the last lines of the plan logs"""
+        url = self._plans_prefix + plan_id
+        response = self.session.get(url)
         response.raise_for_status()
         
         log_url = response.json()["data"]["attributes"]["log-read-url"]
         if log_url:
-            log_response = requests.get(log_url)
-            return log_response.text
+            # Pre-signed URL, the API token must not be sent along.
+            # Logs can be large, so stream them and only keep the tail in memory.
+            with self.session.get(log_url, headers={"Authorization": None, "Content-Type": None},
+                                  stream=True) as log_response:
+                log_response.encoding = log_response.encoding or "utf-8"
+                tail = collections.deque(log_response.iter_lines(decode_unicode=True), maxlen=tail_lines)
+            return "\n".join(tail)
         return "No logs available"
     
     def trigger_run(self, workspace_id: str, message: str = "Automated test run") -> str:
         """Trigger a new run in workspace"""
-        url = f"{API_BASE_URL}/runs"
+        url = self._runs_url
         payload = {
             "data": {
                 "type": "runs",
@@ -77,81 +177,90 @@ class TerraformCloudAPI:
                 }
             }
         }
-        response = requests.post(url, headers=self.headers, json=payload)
+        response = self.session.post(url, json=payload)
         response.raise_for_status()
         return response.json()["data"]["id"]
 
 
+def fetch_current_run(api: TerraformCloudAPI, workspace: Optional[dict]) -> Optional[dict]:
+    """Get the current run of a workspace (if any)"""
+    if not workspace:
+        return None
+    
+    current_run = workspace["relationships"].get("current-run", {}).get("data")
+    if not current_run:
+        return None
+    return api.get_run_status(current_run["id"])
+
+
 def check_workspaces(api: TerraformCloudAPI, workspace_names: List[str], verbose: bool = False):
     """Check status of multiple workspaces"""
     
     print(f"🔍 Checking {len(workspace_names)} workspace(s)...\n")
     
-    for workspace_name in workspace_names:
-        print(f"📊 {workspace_name}")
-        print("=" * (len(workspace_name) + 4))
+    # One paginated listing instead of a GET per workspace
+    all_workspaces = api.list_workspaces()
+    workspaces = [all_workspaces.get(workspace_name) for workspace_name in workspace_names]
+    
+    # Run lookups are I/O bound, fetch them concurrently and print in order afterwards
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        run_infos = list(executor.map(lambda workspace: fetch_current_run(api, workspace), workspaces))
+    
+    # Output is buffered per workspace and written at once instead of one write per line
+    for workspace_name, workspace, run_info in zip(workspace_names, workspaces, run_infos):
+        lines = [f"📊 {workspace_name}", "=" * (len(workspace_name) + 4)]
         
-        workspace = api.get_workspace(workspace_name)
         if not workspace:
-            print("   ❌ Workspace not found")
-            print()
+            lines.append("   ❌ Workspace not found")
+            lines.append("")
+            sys.stdout.write("\n".join(lines) + "\n")
             continue
         
         # Basic workspace info
         attrs = workspace["attributes"]
-        print(f"   Status: {'🔒 Locked' if attrs['locked'] else '🔓 Unlocked'}")
-        print(f"   Terraform: {attrs['terraform-version']}")
-        print(f"   Working Dir: {attrs['working-directory']}")
+        lines.append(f"   Status: {'🔒 Locked' if attrs['locked'] else '🔓 Unlocked'}")
+        lines.append(f"   Terraform: {attrs['terraform-version']}")
+        lines.append(f"   Working Dir: {attrs['working-directory']}")
         
         # VCS info
         vcs_repo = attrs.get("vcs-repo")
         if vcs_repo:
-            print(f"   VCS: {vcs_repo['identifier']} (branch: {vcs_repo['branch']})")
-            print(f"   Submodules: {'✅ Yes' if vcs_repo.get('ingress-submodules', False) else '❌ No'}")
+            lines.append(f"   VCS: {vcs_repo['identifier']} (branch: {vcs_repo['branch']})")
+            lines.append(f"   Submodules: {'✅ Yes' if vcs_repo.get('ingress-submodules', False) else '❌ No'}")
         else:
-            print("   VCS: ❌ Not connected")
+            lines.append("   VCS: ❌ Not connected")
         
         # Latest run info
-        current_run = workspace["relationships"].get("current-run", {}).get("data")
-        if current_run:
-            run_id = current_run["id"]
-            run_info = api.get_run_status(run_id)
+        if run_info:
+            run_id = run_info["id"]
             run_attrs = run_info["attributes"]
             
             status = run_attrs["status"]
             created_at = run_attrs["created-at"]
             message = run_attrs.get("message", "No message")
             
-            status_icon = {
-                "planned": "📋",
-                "planning": "⏳",
-                "applied": "✅",
-                "applying": "⚙️",
-                "errored": "❌",
-                "canceled": "⏹️",
-                "pending": "⏸️"
-            }.get(status, "❓")
+            status_icon = RUN_STATUS_ICONS.get(status, "❓")
             
-            print(f"   Latest Run: {status_icon} {status} ({run_id})")
-            print(f"   Created: {created_at}")
-            print(f"   Message: {message}")
+            lines.append(f"   Latest Run: {status_icon} {status} ({run_id})")
+            lines.append(f"   Created: {created_at}")
+            lines.append(f"   Message: {message}")
             
             if verbose and status == "errored":
                 # Get plan details for error
                 plan_rel = run_info["relationships"].get("plan", {}).get("data")
                 if plan_rel:
                     plan_id = plan_rel["id"]
-                    print(f"   \n   📝 Error logs:")
-                    logs = api.get_plan_logs(plan_id)
+                    lines.append(f"   \n   📝 Error logs:")
                     # Show last few lines of logs
-                    log_lines = logs.split('\n')[-10:]
-                    for line in log_lines:
+                    logs = api.get_plan_logs(plan_id)
+                    for line in logs.split('\n'):
                         if line.strip():
-                            print(f"      {line}")
+                            lines.append(f"      {line}")
         else:
-            print("   Latest Run: 📋 No runs")
+            lines.append("   Latest Run: 📋 No runs")
         
-        print()
+        lines.append("")
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 def trigger_test_runs(api: TerraformCloudAPI, workspace_names: List[str]):
@@ -160,48 +269,63 @@ def trigger_test_runs(api: TerraformCloudAPI, workspace_names: List[str]):
     print(f"🚀 Triggering test runs in {len(workspace_names)} workspace(s)...\n")
     
     run_ids = {}
+    all_workspaces = api.list_workspaces()
+    message = f"Test run for workspace validation - {datetime.now().strftime('%Y-%m-%d %H:%M')}"
     
-    for workspace_name in workspace_names:
-        workspace = api.get_workspace(workspace_name)
-        if not workspace:
-            print(f"   ❌ {workspace_name}: Workspace not found")
-            continue
+    # One bounded worker pool for both triggering and polling, so no more than
+    # MAX_WORKERS requests are in flight against the API at any time
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        trigger_futures = {}
+        for workspace_name in workspace_names:
+            workspace = all_workspaces.get(workspace_name)
+            if not workspace:
+                print(f"   ❌ {workspace_name}: Workspace not found")
+                continue
+            trigger_futures[workspace_name] = executor.submit(api.trigger_run, workspace["id"], message)
+        
+        for workspace_name, future in trigger_futures.items():
+            try:
+                run_id = future.result()
+                run_ids[workspace_name] = run_id
+                print(f"   ✅ {workspace_name}: Run started ({run_id})")
+            except Exception as e:
+                print(f"   ❌ {workspace_name}: Failed to start run - {e}")
+        
+        if not run_ids:
+            return
         
-        workspace_id = workspace["id"]
-        try:
-            run_id = api.trigger_run(workspace_id, f"Test run for workspace validation - {datetime.now().strftime('%Y-%m-%d %H:%M')}")
-            run_ids[workspace_name] = run_id
-            print(f"   ✅ {workspace_name}: Run started ({run_id})")
-        except Exception as e:
-            print(f"   ❌ {workspace_name}: Failed to start run - {e}")
-    
-    if run_ids:
         print(f"\n⏳ Waiting for runs to complete...")
         
-        # Wait for completion
+        # Wait for completion, polling quickly at first and backing off while nothing changes
+        poll_interval = POLL_INTERVAL_MIN
+        last_statuses: Dict[str, str] = {}
         while run_ids:
-            time.sleep(10)
+            time.sleep(poll_interval)
             completed = []
+            changed = False
             
-            for workspace_name, run_id in run_ids.items():
-                run_info = api.get_run_status(run_id)
+            run_infos = executor.map(api.get_run_status, run_ids.values())
+            for workspace_name, run_info in zip(list(run_ids), run_infos):
                 status = run_info["attributes"]["status"]
+                if last_statuses.get(workspace_name) != status:
+                    last_statuses[workspace_name] = status
+                    changed = True
                 
-                if status in ["applied", "errored", "canceled", "discarded"]:
-                    status_icon = {
-                        "applied": "✅",
-                        "errored": "❌",
-                        "canceled": "⏹️",
-                        "discarded": "🗑️"
-                    }.get(status, "❓")
+                if status in COMPLETED_STATUS_ICONS:
+                    status_icon = COMPLETED_STATUS_ICONS[status]
                     
                     print(f"   {status_icon} {workspace_name}: {status}")
                     completed.append(workspace_name)
             
             for workspace_name in completed:
                 del run_ids[workspace_name]
-        
-        print("\n🎉 All runs completed!")
+            
+            if changed:
+                poll_interval = POLL_INTERVAL_MIN
+            else:
+                poll_interval = min(POLL_INTERVAL_MAX, poll_interval * POLL_BACKOFF_FACTOR)
+    
+    print("\n🎉 All runs completed!")
 
 
 def main():
@@ -215,29 +339,7 @@ def main():
     parser.add_argument(
         "--workspaces",
         nargs="+",
-        default=[
-            "aheadlabs-com-production",
-            "aheadlabs-com-staging",
-            "ai-assistant-production",
-            "ai-assistant-staging",
-            "apps-aheadlabs-com-production",
-            "apps-aheadlabs-com-staging",
-            "automations-production",
-            "automations-staging",
-            "campus-aheadlabs-com-production",
-            "campus-aheadlabs-com-staging",
-            "core-infrastructure-production",
-            "core-infrastructure-shared",
-            "core-infrastructure-staging",
-            "ladichosa-es-production",
-            "ladichosa-es-staging",
-            "monitoring-production",
-            "monitoring-staging",
-            "services-aheadlabs-com-production",
-            "services-aheadlabs-com-staging",
-            "signatus-production",
-            "signatus-staging"
-        ],
+        default=list(DEFAULT_WORKSPACES),
         help="Workspace names to check",
     )
     parser.add_argument(
@@ -17,18 +17,31 @@ Usage:
 """
 
 import argparse
-import json
 import sys
-from typing import List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Dict, Optional
+from urllib.parse import urljoin
+
+# orjson parses the (large) JSON:API payloads considerably faster, fall back to json
+try:
+    from orjson import dumps as json_dumps, loads as json_loads
+except ImportError:
+    from json import dumps as json_dumps, loads as json_loads
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util import Retry
 except ImportError:
     print("Error: requests library not installed")
     print("Install with: pip install requests")
     sys.exit(1)
 
 
+MAX_WORKERS = 8
+PAGE_SIZE = 100
+
+
 class HCPTerraformClient:
     """Client for HCP Terraform API operations."""
     
@@ -40,46 +53,82 @@ class HCPTerraformClient:
             "Authorization": f"Bearer {token}",
             "Content-Type": "application/vnd.api+json"
         }
+        # Shared session so every call reuses pooled keep-alive connections
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=32,
+            # Wait for a free keep-alive connection instead of opening (and discarding) extra ones
+            pool_block=True,
+            max_retries=Retry(
+                total=5,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=["GET", "PATCH"],
+                raise_on_status=False,
+            ),
+        )
+        self.session.mount("https://", adapter)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def close(self):
+        """Close the underlying HTTP session."""
+        self.session.close()
+    
+    def get_page(self, url: str, page_number: int) -> Dict:
+        """Get a single page of a paginated listing."""
+        params = {"page[size]": PAGE_SIZE, "page[number]": page_number}
+        response = self.session.get(url, params=params)
+        response.raise_for_status()
+        return json_loads(response.content)
+    
+    def iter_items(self, url: str) -> Iterator[Dict]:
+        """Iterate over the items of every page of a paginated listing, as pages arrive."""
+        data = self.get_page(url, 1)
+        yield from data.get("data", [])
+        
+        total_pages = data.get("meta", {}).get("pagination", {}).get("total-pages")
+        if total_pages is None:
+            # No page count available, follow the next links
+            next_url = data.get("links", {}).get("next")
+            while next_url:
+                response = self.session.get(urljoin(self.base_url, next_url))
+                response.raise_for_status()
+                data = json_loads(response.content)
+                yield from data.get("data", [])
+                next_url = data.get("links", {}).get("next")
+        elif total_pages > 1:
+            # The first page tells how many pages there are, the rest are fetched concurrently
+            with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+                pages = executor.map(lambda page_number: self.get_page(url, page_number), range(2, total_pages + 1))
+                for page in pages:
+                    yield from page.get("data", [])
     
     def list_workspaces(self) -> List[Dict]:
         """List all workspaces in the organization."""
         url = f"{self.base_url}/organizations/{self.organization}/workspaces"
-        workspaces = []
-        
-        while url:
-            response = requests.get(url, headers=self.headers)
-            response.raise_for_status()
-            data = response.json()
-            
-            workspaces.extend(data.get("data", []))
-            
-            # Handle pagination
-            next_url = data.get("links", {}).get("next")
-            url = f"{self.base_url}{next_url}" if next_url else None
-        
-        return workspaces
+        return list(self.iter_items(url))
     
     def get_workspace(self, workspace_name: str) -> Optional[Dict]:
         """Get a specific workspace."""
         url = f"{self.base_url}/organizations/{self.organization}/workspaces/{workspace_name}"
-        response = requests.get(url, headers=self.headers)
+        response = self.session.get(url)
         
         if response.status_code == 404:
             return None
         
         response.raise_for_status()
-        return response.json().get("data")
+        return json_loads(response.content).get("data")
     
-    def enable_submodules(self, workspace_name: str) -> bool:
-        """Enable submodules for a workspace."""
-        url = f"{self.base_url}/workspaces/{workspace_name}"
-        
-        # Get workspace ID first
-        workspace = self.get_workspace(workspace_name)
-        if not workspace:
-            raise ValueError(f"Workspace '{workspace_name}' not found")
-        
-        workspace_id = workspace["id"]
+    def enable_submodules(self, workspace: Dict) -> bool:
+        """Enable submodules for a workspace (as returned by list_workspaces or get_workspace)."""
+        workspace_name = workspace["attributes"]["name"]
         
         # Update workspace to enable submodules
         payload = {
@@ -94,8 +143,8 @@ class HCPTerraformClient:
             }
         }
         
-        url = f"{self.base_url}/workspaces/{workspace_id}"
-        response = requests.patch(url, headers=self.headers, json=payload)
+        url = f"{self.base_url}/organizations/{self.organization}/workspaces/{workspace_name}"
+        response = self.session.patch(url, data=json_dumps(payload))
         response.raise_for_status()
         
         return True
@@ -167,8 +216,12 @@ Examples:
         sys.exit(1)
     
     # Initialize client
-    client = HCPTerraformClient(token, args.organization)
-    
+    with HCPTerraformClient(token, args.organization) as client:
+        run(client, args)
+
+
+def run(client: HCPTerraformClient, args: argparse.Namespace):
+    """Check and enable submodules for the selected workspaces."""
     print("=" * 60)
     print("HCP Terraform Submodules Configuration")
     print("=" * 60)
@@ -198,36 +251,52 @@ Examples:
             "errors": []
         }
         
-        for workspace in workspaces:
-            name = workspace["attributes"]["name"]
-            vcs_repo = workspace["attributes"].get("vcs-repo")
+        # Updates are independent from each other, send them concurrently
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            updates = {}
+            # Status lines are buffered and written once per pass
+            lines = []
             
-            # Skip workspaces without VCS connection
-            if not vcs_repo:
-                results["no_vcs"].append(name)
-                print(f"⚠️  {name}: No VCS connection (skipped)")
-                continue
+            # Extract the fields the decision needs once, up front
+            names = [workspace["attributes"]["name"] for workspace in workspaces]
+            vcs_repos = [workspace["attributes"].get("vcs-repo") for workspace in workspaces]
+            submodule_flags = [vcs_repo.get("ingress-submodules", False) if vcs_repo else None for vcs_repo in vcs_repos]
             
-            submodules_enabled = vcs_repo.get("ingress-submodules", False)
-            
-            if submodules_enabled:
-                results["already_enabled"].append(name)
-                print(f"✅ {name}: Submodules already enabled")
-            else:
-                if args.verify_only:
-                    results["enabled"].append(name)
-                    print(f"❌ {name}: Submodules NOT enabled")
-                elif args.dry_run:
-                    results["enabled"].append(name)
-                    print(f"🔄 {name}: Would enable submodules (dry run)")
+            for workspace, name, submodules_enabled in zip(workspaces, names, submodule_flags):
+                # Skip workspaces without VCS connection
+                if submodules_enabled is None:
+                    results["no_vcs"].append(name)
+                    lines.append(f"⚠️  {name}: No VCS connection (skipped)")
+                    continue
+                
+                if submodules_enabled:
+                    results["already_enabled"].append(name)
+                    lines.append(f"✅ {name}: Submodules already enabled")
                 else:
-                    try:
-                        client.enable_submodules(name)
+                    if args.verify_only:
+                        results["enabled"].append(name)
+                        lines.append(f"❌ {name}: Submodules NOT enabled")
+                    elif args.dry_run:
                         results["enabled"].append(name)
-                        print(f"✅ {name}: Submodules enabled")
-                    except Exception as e:
-                        results["errors"].append({"workspace": name, "error": str(e)})
-                        print(f"❌ {name}: Error - {e}")
+                        lines.append(f"🔄 {name}: Would enable submodules (dry run)")
+                    else:
+                        updates[name] = executor.submit(client.enable_submodules, workspace)
+            
+            if lines:
+                sys.stdout.write("\n".join(lines) + "\n")
+            
+            lines = []
+            for name, future in updates.items():
+                try:
+                    future.result()
+                    results["enabled"].append(name)
+                    lines.append(f"✅ {name}: Submodules enabled")
+                except Exception as e:
+                    results["errors"].append({"workspace": name, "error": str(e)})
+                    lines.append(f"❌ {name}: Error - {e}")
+            
+            if lines:
+                sys.stdout.write("\n".join(lines) + "\n")
         
         # Summary
         print()
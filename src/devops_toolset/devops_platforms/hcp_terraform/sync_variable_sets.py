@@ -6,7 +6,7 @@ This script manages the association of variable sets to workspaces in HCP Terraf
 following the principle of least privilege.
 
 Usage:
-    python sync-variable-sets.py --token YOUR_TOKEN [--dry-run]
+    python sync-variable-sets.py --token YOUR_TOKEN [--dry-run] [--add-only]
     python sync-variable-sets.py --verify-only
     
 Environment Variables:
@@ -14,15 +14,32 @@ Environment Variables:
 """
 
 import argparse
+import json
 import os
+import pathlib
 import sys
-from typing import Dict, List, Set
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional, Set
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+# orjson parses the (large) JSON:API payloads considerably faster, fall back to json
+try:
+    from orjson import dumps as json_dumps, loads as json_loads
+except ImportError:
+    from json import dumps as json_dumps, loads as json_loads
 
 
 # Configuration
 ORGANIZATION = "aheadlabs"
 API_BASE_URL = "https://app.terraform.io/api/v2"
+MAX_WORKERS = 8
+PAGE_SIZE = 100
+# Max workspaces per relationship request
+RELATIONSHIP_BATCH_SIZE = 100
+VARSET_CACHE_PATH = pathlib.Path.home() / ".cache" / "devops-toolset" / "hcp_varsets.json"
 
 # Workspace to cloud provider mapping
 WORKSPACE_CONFIG = {
@@ -75,6 +92,30 @@ VARIABLE_SETS = {
     "aws": "AWS credentials",
 }
 
+# Reverse lookups, built once from the tables above
+PROVIDER_BY_VARSET_NAME = {varset_name: provider for provider, varset_name in VARIABLE_SETS.items()}
+WORKSPACES_BY_PROVIDER = {
+    provider: {name for name, providers in WORKSPACE_CONFIG.items() if provider in providers}
+    for provider in VARIABLE_SETS
+}
+
+
+def load_varset_cache() -> dict:
+    """Load the variable set -> (ETag, workspace IDs) cache used for conditional requests"""
+    try:
+        return json.loads(VARSET_CACHE_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def save_varset_cache(cache: dict):
+    """Persist the variable set -> (ETag, workspace IDs) cache (best effort)"""
+    try:
+        VARSET_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        VARSET_CACHE_PATH.write_text(json.dumps(cache), encoding="utf-8")
+    except OSError:
+        pass
+
 
 class TerraformCloudAPI:
     """HCP Terraform API client"""
@@ -85,22 +126,75 @@ class TerraformCloudAPI:
             "Authorization": f"Bearer {token}",
             "Content-Type": "application/vnd.api+json",
         }
+        # Shared session so every call reuses pooled keep-alive connections
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=32,
+            # Wait for a free keep-alive connection instead of opening (and discarding) extra ones
+            pool_block=True,
+            max_retries=Retry(
+                total=5,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=["GET", "PATCH", "POST", "DELETE"],
+                raise_on_status=False,
+            ),
+        )
+        self.session.mount("https://", adapter)
+        
+        # Variable set associations: in-memory for this run, on disk (with ETag) across runs
+        self._varset_workspaces: Dict[str, Set[str]] = {}
+        self._varset_cache = load_varset_cache()
+        self._varset_cache_lock = threading.Lock()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def close(self):
+        """Close the underlying HTTP session"""
+        self.session.close()
+    
+    def get_page(self, url: str, page_number: int) -> dict:
+        """Get a single page of a paginated listing"""
+        params = {"page[size]": PAGE_SIZE, "page[number]": page_number}
+        response = self.session.get(url, params=params)
+        response.raise_for_status()
+        return json_loads(response.content)
+    
+    def iter_items(self, url: str) -> Iterator[dict]:
+        """Iterate over the items of every page of a paginated listing, as pages arrive"""
+        data = self.get_page(url, 1)
+        yield from data["data"]
+        
+        total_pages = data.get("meta", {}).get("pagination", {}).get("total-pages")
+        if total_pages is None:
+            # No page count available, follow the next links
+            next_url = data.get("links", {}).get("next")
+            while next_url:
+                response = self.session.get(next_url)
+                response.raise_for_status()
+                data = json_loads(response.content)
+                yield from data["data"]
+                next_url = data.get("links", {}).get("next")
+        elif total_pages > 1:
+            # The first page tells how many pages there are, the rest are fetched concurrently
+            with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+                pages = executor.map(lambda page_number: self.get_page(url, page_number), range(2, total_pages + 1))
+                for page in pages:
+                    yield from page["data"]
     
     def get_workspaces(self) -> Dict[str, str]:
         """Get all workspaces in the organization"""
         url = f"{API_BASE_URL}/organizations/{ORGANIZATION}/workspaces"
         workspaces = {}
         
-        while url:
-            response = requests.get(url, headers=self.headers)
-            response.raise_for_status()
-            data = response.json()
-            
-            for workspace in data["data"]:
-                workspaces[workspace["attributes"]["name"]] = workspace["id"]
-            
-            # Handle pagination
-            url = data.get("links", {}).get("next")
+        for workspace in self.iter_items(url):
+            workspaces[workspace["attributes"]["name"]] = workspace["id"]
         
         return workspaces
     
@@ -109,33 +203,38 @@ class TerraformCloudAPI:
         url = f"{API_BASE_URL}/organizations/{ORGANIZATION}/varsets"
         varsets = {}
         
-        while url:
-            response = requests.get(url, headers=self.headers)
-            response.raise_for_status()
-            data = response.json()
-            
-            for varset in data["data"]:
-                varsets[varset["attributes"]["name"]] = {
-                    "id": varset["id"],
-                    "global": varset["attributes"].get("global", False),
-                }
-            
-            url = data.get("links", {}).get("next")
+        for varset in self.iter_items(url):
+            varsets[varset["attributes"]["name"]] = {
+                "id": varset["id"],
+                "global": varset["attributes"].get("global", False),
+            }
         
         return varsets
     
     def get_varset_workspaces(self, varset_id: str) -> Set[str]:
         """Get workspaces associated with a variable set"""
+        if varset_id in self._varset_workspaces:
+            return set(self._varset_workspaces[varset_id])
+        
+        with self._varset_cache_lock:
+            cached = self._varset_cache.get(varset_id)
+        
         # Get variable set details with workspace relationships included
         url = f"{API_BASE_URL}/varsets/{varset_id}?include=workspaces"
-        response = requests.get(url, headers=self.headers)
+        headers = {"If-None-Match": cached["etag"]} if cached else None
+        response = self.session.get(url, headers=headers)
+        
+        if cached and response.status_code == 304:
+            workspace_ids = set(cached["workspace_ids"])
+            self._varset_workspaces[varset_id] = workspace_ids
+            return set(workspace_ids)
         
         if response.status_code == 404:
             print(f"⚠️  Variable set {varset_id} not found")
             return set()
         
         response.raise_for_status()
-        data = response.json()
+        data = json_loads(response.content)
         
         # Extract workspace IDs from relationships
         workspace_ids = set()
@@ -144,28 +243,53 @@ class TerraformCloudAPI:
             if "data" in workspaces_rel and workspaces_rel["data"]:
                 workspace_ids = {ws["id"] for ws in workspaces_rel["data"]}
         
-        return workspace_ids
-    
-    def associate_workspace(self, varset_id: str, workspace_id: str):
-        """Associate a workspace with a variable set"""
+        self._varset_workspaces[varset_id] = workspace_ids
+        etag = response.headers.get("ETag")
+        if etag:
+            with self._varset_cache_lock:
+                self._varset_cache[varset_id] = {"etag": etag, "workspace_ids": sorted(workspace_ids)}
+                save_varset_cache(self._varset_cache)
+        
+        return set(workspace_ids)
+    
+    def invalidate_varset(self, varset_id: str):
+        """Forget cached associations of a variable set after changing them"""
+        self._varset_workspaces.pop(varset_id, None)
+        with self._varset_cache_lock:
+            if self._varset_cache.pop(varset_id, None) is not None:
+                save_varset_cache(self._varset_cache)
+    
+    def associate_workspaces(self, varset_id: str, workspace_ids: List[str]):
+        """Associate workspaces with a variable set"""
+        self.invalidate_varset(varset_id)
         url = f"{API_BASE_URL}/varsets/{varset_id}/relationships/workspaces"
-        payload = {
-            "data": [{"id": workspace_id, "type": "workspaces"}]
-        }
-        response = requests.post(url, headers=self.headers, json=payload)
-        response.raise_for_status()
+        for i in range(0, len(workspace_ids), RELATIONSHIP_BATCH_SIZE):
+            payload = {
+                "data": [
+                    {"id": workspace_id, "type": "workspaces"}
+                    for workspace_id in workspace_ids[i:i + RELATIONSHIP_BATCH_SIZE]
+                ]
+            }
+            response = self.session.post(url, data=json_dumps(payload))
+            response.raise_for_status()
     
-    def disassociate_workspace(self, varset_id: str, workspace_id: str):
-        """Disassociate a workspace from a variable set"""
+    def disassociate_workspaces(self, varset_id: str, workspace_ids: List[str]):
+        """Disassociate workspaces from a variable set"""
+        self.invalidate_varset(varset_id)
         url = f"{API_BASE_URL}/varsets/{varset_id}/relationships/workspaces"
-        payload = {
-            "data": [{"id": workspace_id, "type": "workspaces"}]
-        }
-        response = requests.delete(url, headers=self.headers, json=payload)
-        response.raise_for_status()
+        for i in range(0, len(workspace_ids), RELATIONSHIP_BATCH_SIZE):
+            payload = {
+                "data": [
+                    {"id": workspace_id, "type": "workspaces"}
+                    for workspace_id in workspace_ids[i:i + RELATIONSHIP_BATCH_SIZE]
+                ]
+            }
+            response = self.session.delete(url, data=json_dumps(payload))
+            response.raise_for_status()
     
     def set_global_scope(self, varset_id: str, global_scope: bool):
         """Set or unset global scope for a variable set"""
+        self.invalidate_varset(varset_id)
         url = f"{API_BASE_URL}/varsets/{varset_id}"
         payload = {
             "data": {
@@ -176,14 +300,36 @@ class TerraformCloudAPI:
                 }
             }
         }
-        response = requests.patch(url, headers=self.headers, json=payload)
+        response = self.session.patch(url, data=json_dumps(payload))
         response.raise_for_status()
 
 
+def get_current_associations(
+    api: TerraformCloudAPI,
+    varsets: Dict[str, dict],
+    providers: Optional[List[str]] = None
+) -> Dict[str, Set[str]]:
+    """Get the workspaces associated with every existing, non-global variable set, by provider"""
+    
+    if providers is None:
+        providers = list(VARIABLE_SETS)
+    
+    varset_ids = {
+        provider: varsets[VARIABLE_SETS[provider]]["id"]
+        for provider in providers
+        if VARIABLE_SETS[provider] in varsets and not varsets[VARIABLE_SETS[provider]]["global"]
+    }
+    
+    # No data dependency between variable sets, fetch them concurrently
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        return dict(zip(varset_ids, executor.map(api.get_varset_workspaces, varset_ids.values())))
+
+
 def calculate_changes(
     api: TerraformCloudAPI,
     workspaces: Dict[str, str],
-    varsets: Dict[str, dict]
+    varsets: Dict[str, dict],
+    add_only: bool = False
 ) -> Dict[str, Dict[str, List[str]]]:
     """Calculate required changes to variable set associations"""
     
@@ -193,32 +339,33 @@ def calculate_changes(
         for provider in VARIABLE_SETS.keys()
     }
     
-    for provider, varset_name in VARIABLE_SETS.items():
+    for varset_name in VARIABLE_SETS.values():
         if varset_name not in varsets:
             print(f"⚠️  Variable set '{varset_name}' not found!")
-            continue
-        
-        varset_info = varsets[varset_name]
-        varset_id = varset_info["id"]
-        
-        # If variable set is global, we can't check individual associations
-        # All workspaces already have access
-        if varset_info["global"]:
-            continue
-        
-        current_associations = api.get_varset_workspaces(varset_id)
+    
+    # Only workspaces listed in WORKSPACE_CONFIG are managed, others are left untouched
+    id_to_name = {workspace_id: workspace_name for workspace_name, workspace_id in workspaces.items()}
+    managed_ids = {workspaces[name] for name in WORKSPACE_CONFIG if name in workspaces}
+    desired_ids = {
+        provider: {workspaces[name] for name in WORKSPACES_BY_PROVIDER[provider] if name in workspaces}
+        for provider in VARIABLE_SETS
+    }
+    
+    # When only adding, a variable set no workspace should have can't change: don't fetch it
+    # Global variable sets are skipped, we can't check individual associations
+    # All workspaces already have access
+    associations = get_current_associations(
+        api,
+        varsets,
+        [provider for provider in VARIABLE_SETS if desired_ids[provider] or not add_only]
+    )
+    
+    for provider, current_associations in associations.items():
+        to_add = desired_ids[provider] - current_associations
+        to_remove = set() if add_only else (current_associations & managed_ids) - desired_ids[provider]
         
-        for workspace_name, workspace_id in workspaces.items():
-            if workspace_name not in WORKSPACE_CONFIG:
-                continue
-            
-            should_have = provider in WORKSPACE_CONFIG[workspace_name]
-            currently_has = workspace_id in current_associations
-            
-            if should_have and not currently_has:
-                changes[provider]["add"].append(workspace_name)
-            elif not should_have and currently_has:
-                changes[provider]["remove"].append(workspace_name)
+        changes[provider]["add"] = sorted(id_to_name[workspace_id] for workspace_id in to_add)
+        changes[provider]["remove"] = sorted(id_to_name[workspace_id] for workspace_id in to_remove)
     
     return changes
 
@@ -243,26 +390,36 @@ def apply_changes(
     
     print(f"\n{'DRY RUN - ' if dry_run else ''}Applying {total_changes} changes:\n")
     
-    for provider, varset_name in VARIABLE_SETS.items():
-        if varset_name not in varsets:
-            continue
-        
-        varset_info = varsets[varset_name]
-        varset_id = varset_info["id"]
+    # One request per variable set and direction, variable sets are sent concurrently
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = []
         
-        # Add associations
-        for workspace_name in changes[provider]["add"]:
-            workspace_id = workspaces[workspace_name]
-            print(f"  ➕ Adding {varset_name} to {workspace_name}")
-            if not dry_run:
-                api.associate_workspace(varset_id, workspace_id)
+        for provider, varset_name in VARIABLE_SETS.items():
+            if varset_name not in varsets:
+                continue
+            
+            varset_info = varsets[varset_name]
+            varset_id = varset_info["id"]
+            
+            # Report every change of the variable set in a single write
+            lines = [f"  ➕ Adding {varset_name} to {workspace_name}" for workspace_name in changes[provider]["add"]]
+            lines += [f"  ➖ Removing {varset_name} from {workspace_name}" for workspace_name in changes[provider]["remove"]]
+            if lines:
+                sys.stdout.write("\n".join(lines) + "\n")
+            
+            # Add associations
+            if changes[provider]["add"] and not dry_run:
+                workspace_ids = [workspaces[workspace_name] for workspace_name in changes[provider]["add"]]
+                futures.append(executor.submit(api.associate_workspaces, varset_id, workspace_ids))
+            
+            # Remove associations
+            if changes[provider]["remove"] and not dry_run:
+                workspace_ids = [workspaces[workspace_name] for workspace_name in changes[provider]["remove"]]
+                futures.append(executor.submit(api.disassociate_workspaces, varset_id, workspace_ids))
         
-        # Remove associations
-        for workspace_name in changes[provider]["remove"]:
-            workspace_id = workspaces[workspace_name]
-            print(f"  ➖ Removing {varset_name} from {workspace_name}")
-            if not dry_run:
-                api.disassociate_workspace(varset_id, workspace_id)
+        # Surface the first error, if any
+        for future in futures:
+            future.result()
     
     if dry_run:
         print("\n⚠️  This was a dry run. Use without --dry-run to apply changes.")
@@ -306,28 +463,28 @@ def verify_configuration(
     # Show current associations
     print("\n📊 Current Variable Set Associations:\n")
     
+    associations = get_current_associations(api, varsets)
+    
     for provider, varset_name in VARIABLE_SETS.items():
         if varset_name not in varsets:
             continue
         
-        print(f"\n{varset_name}:")
-        print("-" * 40)
-        
-        varset_info = varsets[varset_name]
-        varset_id = varset_info["id"]
+        # Buffer the report of each variable set and write it at once
+        lines = [f"\n{varset_name}:", "-" * 40]
         
-        if varset_info["global"]:
-            print("  🌍 GLOBAL - All workspaces have access")
+        if varsets[varset_name]["global"]:
+            lines.append("  🌍 GLOBAL - All workspaces have access")
+            sys.stdout.write("\n".join(lines) + "\n")
             continue
         
-        current_associations = api.get_varset_workspaces(varset_id)
+        current_associations = associations[provider]
         
         for workspace_name in sorted(WORKSPACE_CONFIG.keys()):
             if workspace_name not in workspaces:
                 continue
             
             workspace_id = workspaces[workspace_name]
-            should_have = provider in WORKSPACE_CONFIG[workspace_name]
+            should_have = workspace_name in WORKSPACES_BY_PROVIDER[provider]
             currently_has = workspace_id in current_associations
             
             if should_have and currently_has:
@@ -340,7 +497,9 @@ def verify_configuration(
                 status = "⚪"
             
             if should_have or currently_has:
-                print(f"  {status} {workspace_name}")
+                lines.append(f"  {status} {workspace_name}")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
     
     print("\n" + "=" * 80)
 
@@ -363,6 +522,11 @@ def main():
         action="store_true",
         help="Only verify current configuration, don't make changes",
     )
+    parser.add_argument(
+        "--add-only",
+        action="store_true",
+        help="Only add missing associations, don't remove extra ones",
+    )
     parser.add_argument(
         "--convert-to-workspace-specific",
         action="store_true",
@@ -379,8 +543,12 @@ def main():
         sys.exit(1)
     
     # Initialize API client
-    api = TerraformCloudAPI(token)
-    
+    with TerraformCloudAPI(token) as api:
+        run(api, args)
+
+
+def run(api: TerraformCloudAPI, args: argparse.Namespace):
+    """Verify or synchronize variable set associations"""
     try:
         # Fetch current state
         print("🔍 Fetching workspaces and variable sets...")
@@ -394,7 +562,7 @@ def main():
         if args.convert_to_workspace_specific:
             global_varsets = [
                 (name, info) for name, info in varsets.items() 
-                if info["global"] and name in VARIABLE_SETS.values()
+                if info["global"] and name in PROVIDER_BY_VARSET_NAME
             ]
             
             if not global_varsets:
@@ -409,12 +577,14 @@ def main():
                     api.set_global_scope(varset_info["id"], False)
                     
                     # Add associations for appropriate workspaces
-                    provider = [p for p, vs in VARIABLE_SETS.items() if vs == varset_name][0]
+                    provider_workspaces = WORKSPACES_BY_PROVIDER[PROVIDER_BY_VARSET_NAME[varset_name]]
+                    workspace_ids = []
                     for workspace_name, workspace_id in workspaces.items():
-                        if workspace_name in WORKSPACE_CONFIG and provider in WORKSPACE_CONFIG[workspace_name]:
+                        if workspace_name in provider_workspaces:
                             print(f"     ➕ Adding {workspace_name}")
-                            if not args.dry_run:
-                                api.associate_workspace(varset_info["id"], workspace_id)
+                            workspace_ids.append(workspace_id)
+                    if workspace_ids:
+                        api.associate_workspaces(varset_info["id"], workspace_ids)
             
             if args.dry_run:
                 print("\n⚠️  This was a dry run. Use without --dry-run to apply changes.")
@@ -427,7 +597,7 @@ def main():
             verify_configuration(api, workspaces, varsets)
         else:
             # Calculate changes
-            changes = calculate_changes(api, workspaces, varsets)
+            changes = calculate_changes(api, workspaces, varsets, add_only=args.add_only)
             
             # Apply changes
             apply_changes(api, workspaces, varsets, changes, dry_run=args.dry_run)
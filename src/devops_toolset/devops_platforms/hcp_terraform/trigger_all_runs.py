@@ -14,6 +14,8 @@ Options:
     --filter    Filter workspaces by name pattern (e.g., "production", "staging")
     --dry-run   Show what would be triggered without actually triggering
     --confirm   Skip confirmation prompt
+    --cache-ttl Seconds the workspace list is reused from the local cache (default: 60)
+    --no-cache  Always fetch the workspace list from the API
 """
 
 import json
@@ -21,10 +23,46 @@ import os
 import sys
 import time
 import argparse
-import urllib.request
+import gzip
+import http.client
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from functools import lru_cache
 
+# orjson parses the (large) JSON:API payloads considerably faster, fall back to json
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
+API_HOST = "app.terraform.io"
+API_BASE_PATH = "/api/v2"
+
+# Concurrent API calls, kept low enough to stay under HCP Terraform's rate limits
+MAX_WORKERS = 20
+# Largest page size allowed by the API
+PAGE_SIZE = 100
+# Wait loop poll interval (seconds): grows while nothing finishes, resets when a run completes
+POLL_INTERVAL_MIN = 2
+POLL_INTERVAL_MAX = 30
+POLL_BACKOFF_FACTOR = 1.5
+# Runs younger than this (seconds) can't have finished yet, so their status isn't polled
+MIN_RUN_AGE = 5
+# Workspace list cache, reused across invocations while fresher than the TTL (seconds)
+WORKSPACES_CACHE_PATH = os.path.expanduser("~/.cache/devops-toolset/hcp-workspaces.json")
+DEFAULT_CACHE_TTL = 60
+# Attempts for a request throttled with 429 Too Many Requests
+RATE_LIMIT_RETRIES = 3
+# Errors sending a request over a kept-alive connection the server has already dropped: the request
+# never reached the API, so it can be sent again on a new connection
+STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError)
+# Methods that can be sent again after a failure reading the response (e.g. POST /runs would queue
+# a duplicate run)
+IDEMPOTENT_METHODS = ("GET",)
+
+
+@lru_cache(maxsize=None)
 def get_token():
     """Get HCP Terraform token from credentials file."""
     creds_file = os.path.expanduser("~/.terraform.d/credentials.tfrc.json")
@@ -38,53 +76,141 @@ def get_token():
     return creds["credentials"]["app.terraform.io"]["token"]
 
 
+def get_retry_delay(headers):
+    """Get the seconds to wait from the Retry-After or X-RateLimit-Reset headers of a throttled response."""
+    for header in ("Retry-After", "X-RateLimit-Reset"):
+        try:
+            return max(float(headers.get(header)), 0)
+        except (TypeError, ValueError):
+            continue
+    return POLL_INTERVAL_MIN
+
+
+# One keep-alive connection per thread, so TLS handshakes are paid once per worker and not per call
+_connections = threading.local()
+
+
+def get_connection():
+    """Get the HCP Terraform connection of the current thread."""
+    connection = getattr(_connections, "connection", None)
+    if connection is None:
+        connection = _connections.connection = http.client.HTTPSConnection(API_HOST, timeout=60)
+    return connection
+
+
 def api_request(endpoint, token, method="GET", data=None):
     """Make an API request to HCP Terraform."""
-    url = f"https://app.terraform.io/api/v2{endpoint}"
     headers = {
         "Authorization": f"Bearer {token}",
-        "Content-Type": "application/vnd.api+json"
+        "Content-Type": "application/vnd.api+json",
+        # Workspace listings are large and compress well
+        "Accept-Encoding": "gzip"
     }
+    body = json.dumps(data).encode("utf-8") if data else None
     
-    req = urllib.request.Request(url, headers=headers, method=method)
+    for attempt in range(RATE_LIMIT_RETRIES + 1):
+        connection = get_connection()
+        try:
+            connection.request(method, f"{API_BASE_PATH}{endpoint}", body=body, headers=headers)
+        except STALE_CONNECTION_ERRORS:
+            # The server dropped the idle connection: reconnect and try again
+            connection.close()
+            if attempt < RATE_LIMIT_RETRIES:
+                continue
+            raise
+        except (http.client.HTTPException, OSError):
+            connection.close()
+            raise
+        
+        try:
+            response = connection.getresponse()
+            response_body = response.read()
+            if response.getheader("Content-Encoding") == "gzip":
+                response_body = gzip.decompress(response_body)
+        except (http.client.HTTPException, OSError):
+            # The request was sent and may have been processed: only send it again if that is harmless
+            connection.close()
+            if method in IDEMPOTENT_METHODS and attempt < RATE_LIMIT_RETRIES:
+                continue
+            raise
+        
+        # Throttled: wait as long as the API asks before trying again
+        if response.status == 429 and attempt < RATE_LIMIT_RETRIES:
+            time.sleep(get_retry_delay(response.headers))
+            continue
+        
+        if response.status >= 400:
+            print(f"❌ API Error: {response.status} - {response_body.decode('utf-8')}")
+            return None
+        
+        return json_loads(response_body)
+
+
+def load_workspaces_cache(org, ttl):
+    """Load the cached workspaces of the organization, if they are fresher than ttl seconds."""
+    try:
+        with open(WORKSPACES_CACHE_PATH) as f:
+            cached = json.load(f).get(org)
+    except (OSError, ValueError, AttributeError):
+        return None
+    
+    if cached and time.time() - cached["ts"] < ttl:
+        return cached["data"]
+    return None
+
+
+def save_workspaces_cache(org, workspaces):
+    """Persist the workspaces of the organization to the cache (best effort)."""
+    try:
+        with open(WORKSPACES_CACHE_PATH) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        cache = {}
     
-    if data:
-        req.data = json.dumps(data).encode("utf-8")
+    cache[org] = {"ts": time.time(), "data": workspaces}
     
     try:
-        with urllib.request.urlopen(req) as response:
-            return json.load(response)
-    except urllib.error.HTTPError as e:
-        error_body = e.read().decode("utf-8")
-        print(f"❌ API Error: {e.code} - {error_body}")
-        return None
+        os.makedirs(os.path.dirname(WORKSPACES_CACHE_PATH), exist_ok=True)
+        with open(WORKSPACES_CACHE_PATH, "w") as f:
+            json.dump(cache, f)
+    except OSError:
+        pass
 
 
-def get_all_workspaces(token, org="aheadlabs"):
-    """Get all workspaces in the organization."""
-    workspaces = []
-    page = 1
-    
-    while True:
-        endpoint = f"/organizations/{org}/workspaces?page%5Bnumber%5D={page}&page%5Bsize%5D=50"
-        result = api_request(endpoint, token)
-        
-        if not result:
-            break
-        
-        workspaces.extend(result["data"])
-        
-        # Check for more pages
-        if result.get("meta", {}).get("pagination", {}).get("next-page"):
-            page += 1
-        else:
-            break
+def get_all_workspaces(token, org="aheadlabs", cache_ttl=0):
+    """Get all workspaces in the organization, from the local cache if it's fresher than cache_ttl seconds."""
+    if cache_ttl > 0:
+        cached = load_workspaces_cache(org, cache_ttl)
+        if cached is not None:
+            return cached
+    
+    endpoint = f"/organizations/{org}/workspaces?page%5Bsize%5D={PAGE_SIZE}&page%5Bnumber%5D="
+    
+    result = api_request(f"{endpoint}1", token)
+    if not result:
+        return []
+    
+    workspaces = list(result["data"])
+    total_pages = result.get("meta", {}).get("pagination", {}).get("total-pages") or 1
+    
+    # The first page tells how many there are, fetch the rest concurrently
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        for result in executor.map(lambda page: api_request(f"{endpoint}{page}", token), range(2, total_pages + 1)):
+            if not result:
+                # Don't cache an incomplete list
+                return workspaces
+            workspaces.extend(result["data"])
+    
+    if cache_ttl > 0:
+        save_workspaces_cache(org, workspaces)
     
     return workspaces
 
 
 def trigger_run(token, workspace_id, workspace_name, auto_apply=False, message=None):
-    """Trigger a run in a workspace."""
+    """Trigger a run in a workspace, returning its id and initial status."""
+    # The runs API creates a single run per request (there's no bulk endpoint), so a batch is
+    # triggered as concurrent requests that share the same message
     if message is None:
         message = f"Triggered by trigger-all-runs.py at {datetime.now().isoformat()}"
     
@@ -109,9 +235,9 @@ def trigger_run(token, workspace_id, workspace_name, auto_apply=False, message=N
     result = api_request("/runs", token, method="POST", data=data)
     
     if result:
-        run_id = result["data"]["id"]
-        return run_id
-    return None
+        # The created run already carries its initial status
+        return result["data"]["id"], result["data"]["attributes"].get("status")
+    return None, None
 
 
 def get_run_status(token, run_id):
@@ -156,6 +282,17 @@ def main():
         type=str,
         help="Exclude workspaces matching pattern"
     )
+    parser.add_argument(
+        "--cache-ttl",
+        type=int,
+        default=DEFAULT_CACHE_TTL,
+        help=f"Seconds the workspace list is reused from the local cache (default: {DEFAULT_CACHE_TTL})"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always fetch the workspace list from the API"
+    )
     
     args = parser.parse_args()
     
@@ -164,17 +301,20 @@ def main():
     print("=" * 60)
     
     token = get_token()
-    workspaces = get_all_workspaces(token)
+    workspaces = get_all_workspaces(token, cache_ttl=0 if args.no_cache else args.cache_ttl)
     
-    # Filter workspaces
-    if args.filter:
-        workspaces = [w for w in workspaces if args.filter.lower() in w["attributes"]["name"].lower()]
+    # Filter and sort workspaces by name in a single pass
+    include = args.filter.lower() if args.filter else None
+    exclude = args.exclude.lower() if args.exclude else None
     
-    if args.exclude:
-        workspaces = [w for w in workspaces if args.exclude.lower() not in w["attributes"]["name"].lower()]
-    
-    # Sort by name
-    workspaces = sorted(workspaces, key=lambda w: w["attributes"]["name"])
+    workspaces = sorted(
+        (
+            w for w in workspaces
+            if (include is None or include in w["attributes"]["name"].lower())
+            and (exclude is None or exclude not in w["attributes"]["name"].lower())
+        ),
+        key=lambda w: w["attributes"]["name"]
+    )
     
     print(f"\n📋 Found {len(workspaces)} workspaces")
     print("-" * 60)
@@ -206,18 +346,28 @@ def main():
     print("-" * 60)
     
     triggered_runs = []
+    message = f"Triggered by trigger-all-runs.py at {datetime.now().isoformat()}"
     
-    for ws in workspaces:
-        ws_id = ws["id"]
-        ws_name = ws["attributes"]["name"]
+    # Triggers are independent from each other, send them concurrently and report each one as it lands
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = {}
+        for ws in workspaces:
+            ws_name = ws["attributes"]["name"]
+            future = executor.submit(trigger_run, token, ws["id"], ws_name, auto_apply=args.apply, message=message)
+            futures[future] = ws_name
         
-        run_id = trigger_run(token, ws_id, ws_name, auto_apply=args.apply)
-        
-        if run_id:
-            print(f"   ✅ {ws_name}: {run_id}")
-            triggered_runs.append({"name": ws_name, "run_id": run_id})
-        else:
-            print(f"   ❌ {ws_name}: Failed to trigger")
+        for future in as_completed(futures):
+            ws_name = futures[future]
+            run_id, status = future.result()
+            
+            if run_id:
+                print(f"   ✅ {ws_name}: {run_id}")
+                triggered_runs.append({"name": ws_name, "run_id": run_id, "status": status, "triggered_at": time.monotonic()})
+            else:
+                print(f"   ❌ {ws_name}: Failed to trigger")
+    
+    # Keep the rest of the report in workspace order
+    triggered_runs.sort(key=lambda run: run["name"])
     
     print("-" * 60)
     print(f"\n✅ Triggered {len(triggered_runs)}/{len(workspaces)} runs")
@@ -231,26 +381,41 @@ def main():
         completed = []
         failed = []
         
-        while pending:
-            time.sleep(10)  # Poll every 10 seconds
+        # Status checks of one tick are independent, fetch them concurrently
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            poll_interval = POLL_INTERVAL_MIN
             
-            still_pending = []
-            for run in pending:
-                status = get_run_status(token, run["run_id"])
+            while pending:
+                time.sleep(poll_interval)
                 
-                if status in ["planned", "applied", "planned_and_finished"]:
-                    completed.append(run)
-                    print(f"   ✅ {run['name']}: {status}")
-                elif status in ["errored", "canceled", "force_canceled", "discarded"]:
-                    failed.append(run)
-                    print(f"   ❌ {run['name']}: {status}")
+                # Only refresh the runs old enough to have progressed, the rest keep their last known status
+                now = time.monotonic()
+                due = [run for run in pending if now - run["triggered_at"] >= MIN_RUN_AGE]
+                for run, status in zip(due, executor.map(lambda run: get_run_status(token, run["run_id"]), due)):
+                    run["status"] = status
+                
+                still_pending = []
+                for run in pending:
+                    status = run["status"]
+                    if status in ["planned", "applied", "planned_and_finished"]:
+                        completed.append(run)
+                        print(f"   ✅ {run['name']}: {status}")
+                    elif status in ["errored", "canceled", "force_canceled", "discarded"]:
+                        failed.append(run)
+                        print(f"   ❌ {run['name']}: {status}")
+                    else:
+                        still_pending.append(run)
+                
+                # Poll again soon after progress, back off while everything is still running
+                if len(still_pending) < len(pending):
+                    poll_interval = POLL_INTERVAL_MIN
                 else:
-                    still_pending.append(run)
-            
-            pending = still_pending
-            
-            if pending:
-                print(f"   ⏳ {len(pending)} runs still in progress...")
+                    poll_interval = min(POLL_INTERVAL_MAX, poll_interval * POLL_BACKOFF_FACTOR)
+                
+                pending = still_pending
+                
+                if pending:
+                    print(f"   ⏳ {len(pending)} runs still in progress...")
         
         print("-" * 60)
         print(f"\n📊 Results:")
@@ -264,8 +429,11 @@ def main():
     
     # Print URLs
     print("\n🔗 Run URLs:")
-    for run in triggered_runs:
-        print(f"   https://app.terraform.io/app/aheadlabs/workspaces/{run['name']}/runs/{run['run_id']}")
+    if triggered_runs:
+        sys.stdout.write("\n".join(
+            f"   https://app.terraform.io/app/aheadlabs/workspaces/{run['name']}/runs/{run['run_id']}"
+            for run in triggered_runs
+        ) + "\n")
 
 
 if __name__ == "__main__":
@@ -1,5 +1,6 @@
 """Contains paths-related operations."""
 
+import fnmatch
 import logging
 import os
 import pathlib
@@ -9,7 +10,7 @@ from devops_toolset.core.app import App
 from devops_toolset.core.literals_core import LiteralsCore
 from devops_toolset.filesystem.literals import Literals as FileSystemLiterals
 from devops_toolset.filesystem.constants import Directions, FileNames, FileType
-from typing import List, Tuple, Union
+from typing import Collection, List, Optional, Tuple, Union
 from urllib.parse import urlparse
 
 app: App = App()
@@ -156,12 +157,15 @@ def get_file_path_from_pattern_multiple_paths(paths: list, pattern: str, recursi
     return None
 
 
-def get_file_paths_in_tree(starting_path: str, glob: str) -> List[pathlib.Path]:
+def get_file_paths_in_tree(
+        starting_path: str, glob: str, excluded_dirs: Optional[Collection[str]] = None) -> List[pathlib.Path]:
     """Gets a list with the paths to the descendant files that match the glob pattern.
 
     Args:
         starting_path: Path to start the seek from.
         glob: glob pattern to match the files that should be found.
+        excluded_dirs: Names of the directories that are not descended into
+            (e.g. .git or node_modules).
 
     Returns:
         List with the paths to the files that match.
@@ -169,8 +173,16 @@ def get_file_paths_in_tree(starting_path: str, glob: str) -> List[pathlib.Path]:
 
     paths = []
 
-    for guess_path in pathlib.Path(starting_path).rglob(glob):
-        paths.append(guess_path)
+    if not excluded_dirs:
+        for guess_path in pathlib.Path(starting_path).rglob(glob):
+            paths.append(guess_path)
+
+        return paths
+
+    # Prune excluded directories before descending, so their contents are never listed
+    for root, dirs, files in os.walk(starting_path):
+        dirs[:] = [directory for directory in dirs if directory not in excluded_dirs]
+        paths.extend(pathlib.Path(root, file) for file in fnmatch.filter(files, glob))
 
     return paths
 
@@ -2,8 +2,15 @@
 import json
 import logging
 import yaml
+from concurrent.futures import ThreadPoolExecutor
 
-from devops_toolset.core import log_tools
+try:
+    # orjson parses large az CLI outputs several times faster, its JSONDecodeError subclasses json's
+    from orjson import loads as json_loads
+except ImportError:  # pragma: no cover
+    from json import loads as json_loads
+
+import devops_toolset.core.log_tools as log_tools
 from devops_toolset.core.app import App
 from devops_toolset.core.commands_core import CommandsCore
 from devops_toolset.core.literals_core import LiteralsCore
@@ -16,6 +23,15 @@ app: App = App()
 literals = LiteralsCore([AzureLiterals])
 commands = CommandsCore([AzureCommands])
 
+# Directories never searched for OpenAPI contracts
+SKIPPED_DIRS = frozenset({".git", "node_modules", ".venv", "venv", "__pycache__", "dist", "build"})
+
+# Max threads used to scan OpenAPI contracts
+MAX_WORKERS = 32
+
+# libyaml-backed loader when PyYAML was built with it, pure-Python otherwise
+YamlSafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def check_apim_exists(resource_group_name, apim_name):
     """Checks if an API Management service exists.
@@ -60,9 +76,11 @@ def get_apim_apis(resource_group_name, apim_name):
 
     if isinstance(result, str):
         try:
-            json_result = json.loads(result)
+            json_result = json_loads(result)
             logging.info(literals.get("azure_cli_apim_apis_found").format(number=len(json_result), name=apim_name))
-            log_tools.log_list(['\t' + api.get('displayName') for api in json_result])
+            log_tools.log_list(
+                ('\t' + (api.get('displayName') or api.get('name') or '') for api in json_result), single_record=True
+            )
             return json_result
         except json.JSONDecodeError:
             logging.error(literals.get("azure_cli_command_output").format(output=result))
@@ -87,14 +105,17 @@ def get_openapi_contracts(base_path):
     """
 
     # Get a list of all OpenAPI contracts paths
-    contract_paths = get_file_paths_in_tree(base_path, "*.openapi.y*ml")
+    contract_paths = get_file_paths_in_tree(base_path, "*.openapi.y*ml", SKIPPED_DIRS)
     logging.info(literals.get("openapi_contracts_found").format(number=len(contract_paths), directory=base_path))
-    log_tools.log_list(["\t" + str(path) for path in contract_paths])
+    log_tools.log_list(("\t" + str(path) for path in contract_paths), single_record=True)
 
     # Parse the contracts and filter out the ones that don't have a x-deploy property with value true
-    contracts = [contract for contract in contract_paths if is_openapi_contract_deployable(contract)]
+    # Each contract is read and checked independently, so scan them concurrently
+    with ThreadPoolExecutor(max_workers=max(1, min(MAX_WORKERS, len(contract_paths)))) as executor:
+        deployable = list(executor.map(is_openapi_contract_deployable, contract_paths))
+    contracts = [contract for contract, is_deployable in zip(contract_paths, deployable) if is_deployable]
     logging.info(literals.get("openapi_contracts_found_deployable").format(number=len(contracts)))
-    log_tools.log_list(["\t" + str(path) for path in contracts])
+    log_tools.log_list(("\t" + str(path) for path in contracts), single_record=True)
 
     return contracts
 
@@ -109,6 +130,12 @@ def is_openapi_contract_deployable(contract_path):
         True if the contract is deployable, False otherwise.
     """
 
-    with open(contract_path, 'r') as contract_file:
-        contract = yaml.safe_load(contract_file)
-        return contract.get('x-deploy', False)
+    with open(contract_path, 'rb') as contract_file:
+        content = contract_file.read()
+
+    # A contract that doesn't even mention x-deploy can't be deployable, skip parsing it
+    if b'x-deploy' not in content:
+        return False
+
+    contract = yaml.load(content, Loader=YamlSafeLoader)
+    return contract.get('x-deploy', False)
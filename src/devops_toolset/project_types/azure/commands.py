@@ -19,8 +19,11 @@ class Commands(ValueDictsBase):
 
     # Add your dotnet commands dictionaries here
     _commands = {
-        "azure_cli_apim_exists": "az apim show --resource-group {resource_group_name} --name {name}",
-        "azure_cli_apim_get_apis": "az apim api list --resource-group {resource_group_name} --service-name {name}",
+        "azure_cli_apim_exists":
+            "az apim show --resource-group {resource_group_name} --name {name} --query id --output tsv "
+            "--only-show-errors",
+        "azure_cli_apim_get_apis":
+            "az apim api list --resource-group {resource_group_name} --service-name {name} --only-show-errors",
         "azure_cli_db_mysql_flexible_server_execute":
             "az mysql flexible-server execute -n {server_name} -u {admin_user} -p {admin_password} "
             "-d {database_name} {file_path} {query} {log}",
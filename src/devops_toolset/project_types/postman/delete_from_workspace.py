@@ -18,25 +18,54 @@ from __future__ import annotations
 
 import argparse
 import os
-from typing import Any, cast
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from typing import Any, Optional, cast
 
 try:
     # Normal package import
     from devops_toolset.project_types.postman.deploy_to_workspace import (
         _request_json,
+        _size_session_pool,
         get_workspace_assets,
+        PostmanWorkspaceAssets,
         DEFAULT_API_BASE_URL,
+        DEFAULT_CONCURRENCY,
         DEFAULT_TIMEOUT_SECONDS,
     )
 except ImportError:  # pragma: no cover
     # Allow running this file directly
     from deploy_to_workspace import (  # type: ignore
         _request_json,
+        _size_session_pool,
         get_workspace_assets,
+        PostmanWorkspaceAssets,
         DEFAULT_API_BASE_URL,
+        DEFAULT_CONCURRENCY,
         DEFAULT_TIMEOUT_SECONDS,
     )
 
+# Version suffixes like " v1-rev0", " v1.0.0" or " v1-rev0 v1.0.0" at the end of a collection name
+_VERSION_RE = re.compile(r'\s+v\d+([-.]\w+)*(\s+v?\d+(\.\d+)*)?$', re.IGNORECASE)
+# Same suffixes followed by an optional stage like " - Staging" at the end of an environment name
+_VERSION_ENV_RE = re.compile(r'\s+v\d+([-.]\w+)*(\s+v?\d+(\.\d+)*)?(\s+-\s+\w+)?$', re.IGNORECASE)
+
+# Words kept uppercase when turning an x-api-id slug back into a name
+_ACRONYMS = frozenset({'api', 'ai', 'ui', 'id', 'url', 'http', 'https', 'rest', 'json', 'xml'})
+
+
+@lru_cache(maxsize=None)
+def _name_pattern_from_api_id(x_api_id: str) -> str:
+    """
+    Convert an x-api-id slug to a name pattern (e.g., "ai-personal-assistant-api" -> "AI Personal Assistant API").
+    This is a best-effort conversion since the original casing is lost in the slug, common acronyms are uppercased.
+    """
+    return ' '.join(
+        word.upper() if word.lower() in _ACRONYMS else word.capitalize() for word in x_api_id.split('-')
+    )
+
 
 def delete_by_api_id(
     base_url: str,
@@ -44,6 +73,8 @@ def delete_by_api_id(
     workspace_id: str,
     x_api_id: str,
     dry_run: bool = False,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    assets: Optional[PostmanWorkspaceAssets] = None,
 ) -> tuple[list[str], list[str]]:
     """
     Delete all collections and environments matching x-api-id from workspace.
@@ -57,66 +88,65 @@ def delete_by_api_id(
         workspace_id: Target workspace ID
         x_api_id: The x-api-id to match (we'll derive pattern from this)
         dry_run: If True, only report what would be deleted without actually deleting
+        concurrency: Max simultaneous Postman API requests
+        assets: Workspace assets already fetched (fetched here if omitted)
         
     Returns:
         Tuple of (deleted_collection_uids, deleted_environment_uids)
     """
-    import re
-    
-    assets = get_workspace_assets(base_url, api_key, workspace_id)
+    if assets is None:
+        # Matching is done by name, x-api-ids aren't needed
+        assets = get_workspace_assets(
+            base_url, api_key, workspace_id, concurrency=concurrency, include_api_ids=False
+        )
     
     deleted_collections: list[str] = []
     deleted_environments: list[str] = []
     
-    # Convert x-api-id slug to name pattern (e.g., "ai-personal-assistant-api" -> "AI Personal Assistant API")
-    # This is a best-effort conversion since the original casing is lost in the slug
-    # We'll uppercase common acronyms
-    words = x_api_id.split('-')
-    name_words = []
-    acronyms = {'api', 'ai', 'ui', 'id', 'url', 'http', 'https', 'rest', 'json', 'xml'}
-    for word in words:
-        if word.lower() in acronyms:
-            name_words.append(word.upper())
-        else:
-            name_words.append(word.capitalize())
-    name_pattern = ' '.join(name_words)
+    name_pattern = _name_pattern_from_api_id(x_api_id)
     
     print(f"Searching for collections/environments matching: '{name_pattern}'")
     print("=" * 70)
     
-    # Find and delete collections with matching name (ignoring version suffix)
+    # Find collections and environments to delete, then delete them concurrently
+    targets: list[tuple[str, str, str]] = []
     for name, uid in assets.collections_by_name.items():
         # Remove version suffixes like " v1-rev0", " v1.0.0", " v1-rev0 v1.0.0" from name for comparison
         # Matches patterns like: v1, v1.0, v1.0.0, v1-rev0, v2-rev1, etc. (with or without version number after)
-        base_name = re.sub(r'\s+v\d+([-.]\w+)*(\s+v?\d+(\.\d+)*)?$', '', name, flags=re.IGNORECASE).strip()
+        base_name = _VERSION_RE.sub('', name).strip()
         if base_name == name_pattern:
-            if dry_run:
-                print(f"🔍 [DRY-RUN] Would delete collection: {name} ({uid})")
-            else:
-                try:
-                    _request_json("DELETE", base_url, f"/collections/{uid}", api_key)
-                    print(f"✅ Deleted collection: {name} ({uid})")
-                    deleted_collections.append(uid)
-                except Exception as e:
-                    print(f"❌ Failed to delete collection {name}: {e}")
+            targets.append(("collection", name, uid))
     
-    # Find and delete environments with matching name pattern
     for name, uid in assets.environments_by_name.items():
         # Match pattern like "Test API v1-rev0 v1.0.0 - Staging"
         # Remove both " v1-rev0 v1.0.0" and " - Staging" parts
-        base_name = re.sub(r'\s+v\d+([-.]\w+)*(\s+v?\d+(\.\d+)*)?(\s+-\s+\w+)?$', '', name, flags=re.IGNORECASE).strip()
+        base_name = _VERSION_ENV_RE.sub('', name).strip()
         if base_name == name_pattern:
-            if dry_run:
-                print(f"🔍 [DRY-RUN] Would delete environment: {name} ({uid})")
+            targets.append(("environment", name, uid))
+    
+    if dry_run:
+        sys.stdout.write("".join(f"🔍 [DRY-RUN] Would delete {kind}: {name} ({uid})\n" for kind, name, uid in targets))
+        return (deleted_collections, deleted_environments)
+    
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        futures = {
+            executor.submit(_request_json, "DELETE", base_url, f"/{kind}s/{uid}", api_key): (kind, name, uid)
+            for kind, name, uid in targets
+        }
+        for future in as_completed(futures):
+            kind, name, uid = futures[future]
+            try:
+                future.result()
+            except Exception as e:
+                print(f"❌ Failed to delete {kind} {name}: {e}")
+                continue
+            print(f"✅ Deleted {kind}: {name} ({uid})")
+            if kind == "collection":
+                deleted_collections.append(uid)
             else:
-                try:
-                    _request_json("DELETE", base_url, f"/environments/{uid}", api_key)
-                    print(f"✅ Deleted environment: {name} ({uid})")
-                    deleted_environments.append(uid)
-                except Exception as e:
-                    print(f"❌ Failed to delete environment {name}: {e}")
+                deleted_environments.append(uid)
     
-    if not deleted_collections and not deleted_environments and not dry_run:
+    if not deleted_collections and not deleted_environments:
         print(f"ℹ️  No collections or environments found matching: {name_pattern}")
     
     return (deleted_collections, deleted_environments)
@@ -157,8 +187,15 @@ def main(argv: list[str] | None = None) -> int:
         action="store_true",
         help="Show what would be deleted without actually deleting",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Max simultaneous Postman API requests (default: {DEFAULT_CONCURRENCY})",
+    )
 
     args = parser.parse_args(argv)
+    _size_session_pool(args.concurrency)
 
     api_key = str(args.api_key or os.getenv("POSTMAN_API_KEY") or "").strip()
     if not api_key:
@@ -179,22 +216,16 @@ def main(argv: list[str] | None = None) -> int:
     print("=" * 70)
     
     print("Fetching workspace assets...")
-    assets = get_workspace_assets(base_url, api_key, workspace_id)
-    print(f"Found {len(assets.collections_by_name)} collections by name")
-    if assets.collections_by_name:
-        for name in assets.collections_by_name.keys():
-            print(f"  - {name}")
-    print(f"Found {len(assets.collections_by_api_id)} collections by x-api-id")
-    print(f"Found {len(assets.environments_by_name)} environments by name")
-    if assets.environments_by_name:
-        for name in assets.environments_by_name.keys():
-            print(f"  - {name}")
-    print(f"Found {len(assets.environments_by_api_id)} environments by x-api-id")
-    if assets.collections_by_api_id:
-        print(f"x-api-id values found in collections: {list(assets.collections_by_api_id.keys())}")
-    if assets.environments_by_api_id:
-        print(f"x-api-id values found in environments: {list(assets.environments_by_api_id.keys())}")
-    print("=" * 70)
+    assets = get_workspace_assets(
+        base_url, api_key, workspace_id, concurrency=args.concurrency, include_api_ids=False
+    )
+    # The listing can be long: emit it with a single write
+    lines = [f"Found {len(assets.collections_by_name)} collections by name"]
+    lines.extend(f"  - {name}" for name in assets.collections_by_name)
+    lines.append(f"Found {len(assets.environments_by_name)} environments by name")
+    lines.extend(f"  - {name}" for name in assets.environments_by_name)
+    lines.append("=" * 70)
+    sys.stdout.write("\n".join(lines) + "\n")
 
     deleted_colls, deleted_envs = delete_by_api_id(
         base_url,
@@ -202,6 +233,8 @@ def main(argv: list[str] | None = None) -> int:
         workspace_id,
         x_api_id,
         dry_run=dry_run,
+        concurrency=args.concurrency,
+        assets=assets,
     )
 
     print("=" * 70)
@@ -23,17 +23,97 @@ Examples:
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
 import os
-from dataclasses import dataclass
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Optional, cast
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+# orjson reads/serializes (multi-MB) collection exports considerably faster, fall back to json
+try:
+    from orjson import dumps as json_dumps, loads as json_loads
+except ImportError:
+    from json import dumps as json_dumps, loads as json_loads
 
 
 DEFAULT_API_BASE_URL = "https://api.postman.com"
 DEFAULT_TIMEOUT_SECONDS = 30
+# Max simultaneous requests when fetching/deleting many assets, lower it if Postman answers 429
+DEFAULT_CONCURRENCY = 10
+# Connections kept alive per host, grown to --concurrency when it is higher
+DEFAULT_POOL_MAXSIZE = 32
+# x-api-id of every workspace asset, reused across invocations while fresher than the TTL (seconds)
+API_IDS_CACHE_PATH = os.path.expanduser("~/.cache/devops-toolset/postman-api-ids.json")
+# SHA-256 of the last payload deployed to every asset. Only with --skip-unchanged-ttl an unchanged payload
+# isn't uploaded again: the local hash can't tell whether the asset was edited in Postman since
+PAYLOAD_HASHES_CACHE_PATH = os.path.expanduser("~/.cache/devops-toolset/postman-payload-hashes.json")
+DEFAULT_CACHE_TTL = 300
+
+# Version patterns like " v1-rev0", " v1.0.0" or " v1-rev0 v1.0.0"
+_VERSION_ANY_RE = re.compile(r'\s+v\d+([-.]\w+)*(\s+v?\d+(\.\d+)*)?', re.IGNORECASE)
+
+
+class _PostmanRetry(Retry):
+    """Retry that also retries POSTs answered with 429 and reports every retry on stderr."""
+
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        # A rate-limited request wasn't processed, so retrying a POST can't create a duplicate
+        if method == "POST" and status_code == 429:
+            return True
+        return super().is_retry(method, status_code, has_retry_after)
+
+    def increment(self, method: Optional[str] = None, url: Optional[str] = None, *args: Any, **kwargs: Any) -> Retry:
+        new_retry = super().increment(method, url, *args, **kwargs)
+        last = new_retry.history[-1]
+        print(
+            f"⚠️  Retrying {method} {url} ({last.status or last.error}), attempt {len(new_retry.history)}",
+            file=sys.stderr,
+        )
+        return new_retry
+
+
+def _mount_adapter(session: requests.Session, pool_maxsize: int) -> None:
+    """Mount an adapter that keeps up to pool_maxsize connections per host alive and retries transient errors."""
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=pool_maxsize,
+        max_retries=_PostmanRetry(
+            total=5,
+            # 0.5s, 1s, 2s, 4s... unless Postman sends a Retry-After header, which is honored
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            # Let the last error response through so it's reported as a PostmanApiError
+            raise_on_status=False,
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+
+def _create_session() -> requests.Session:
+    """Create a session that keeps connections to the Postman API alive and retries transient errors."""
+    session = requests.Session()
+    _mount_adapter(session, DEFAULT_POOL_MAXSIZE)
+    return session
+
+
+def _size_session_pool(concurrency: int) -> None:
+    """Grow the shared session's pool so that concurrency simultaneous requests all reuse their connections."""
+    if concurrency > DEFAULT_POOL_MAXSIZE:
+        _mount_adapter(_SESSION, concurrency)
+
+
+# Shared by every call, so only the first request to the API pays the TCP/TLS handshake
+_SESSION = _create_session()
 
 
 @dataclass(frozen=True)
@@ -42,6 +122,9 @@ class PostmanWorkspaceAssets:
     collections_by_api_id: dict[str, str]
     environments_by_name: dict[str, str]
     environments_by_api_id: dict[str, str]
+    # Name without version suffix -> uid of the first asset carrying it
+    collections_by_base_name: dict[str, str] = field(default_factory=dict)
+    environments_by_base_name: dict[str, str] = field(default_factory=dict)
 
 
 class PostmanApiError(RuntimeError):
@@ -49,8 +132,7 @@ class PostmanApiError(RuntimeError):
 
 
 def _load_json_file(path: Path) -> dict[str, Any]:
-    with path.open("r", encoding="utf-8") as f:
-        raw = json.load(f)
+    raw = json_loads(path.read_bytes())
     if not isinstance(raw, dict):
         raise ValueError(f"Expected a JSON object in {path}")
     return cast(dict[str, Any], raw)
@@ -124,41 +206,23 @@ def _strip_version_from_name(name: str) -> str:
         "Test API v1-rev0 v1.0.0" -> "Test API"
         "Test API v2-rev1 v2.5.0 - Development" -> "Test API - Development"
     """
-    import re
+    # Every version pattern starts with "v": most unversioned names skip the regex entirely
+    if "v" not in name and "V" not in name:
+        return name.strip()
     # Remove patterns like " v1-rev0", " v1.0.0", " v1-rev0 v1.0.0"
-    stripped = re.sub(r'\s+v\d+([-.]\w+)*(\s+v?\d+(\.\d+)*)?', '', name, flags=re.IGNORECASE)
+    stripped = _VERSION_ANY_RE.sub('', name)
     return stripped.strip()
 
 
 def _find_uid_by_base_name(
     name_to_find: str,
-    assets_by_name: dict[str, str]
+    assets_by_base_name: dict[str, str]
 ) -> str | None:
     """
     Find a resource UID by comparing base names (without version suffixes).
     Returns the UID of the first match, or None if no match found.
     """
-    base_name_to_find = _strip_version_from_name(name_to_find)
-    
-    for existing_name, uid in assets_by_name.items():
-        base_existing_name = _strip_version_from_name(existing_name)
-        if base_existing_name == base_name_to_find:
-            return uid
-    
-    return None
-
-
-
-    if "environment" in env_export and isinstance(env_export.get("environment"), dict):
-        env_obj = cast(dict[str, Any], env_export["environment"])
-    else:
-        env_obj = env_export
-    
-    api_id = str(env_obj.get("x-api-id", "")).strip()
-    if api_id:
-        return api_id
-    # Fallback to name for backward compatibility
-    return _environment_name_from_export(env_export)
+    return assets_by_base_name.get(_strip_version_from_name(name_to_find))
 
 
 def _wrap_collection_for_api(collection_export: dict[str, Any]) -> dict[str, Any]:
@@ -195,6 +259,7 @@ def _request_json(
     params: Optional[dict[str, str]] = None,
     payload: Optional[dict[str, Any]] = None,
     timeout_seconds: int = DEFAULT_TIMEOUT_SECONDS,
+    session: Optional[requests.Session] = None,
 ) -> dict[str, Any]:
     url = base_url.rstrip("/") + path
     headers = {
@@ -203,12 +268,13 @@ def _request_json(
         "Content-Type": "application/json",
     }
 
-    resp = requests.request(
+    resp = (session or _SESSION).request(
         method=method,
         url=url,
         headers=headers,
         params=params,
-        json=payload,
+        # Serialized here rather than with json=, so orjson is used when available
+        data=json_dumps(payload) if payload is not None else None,
         timeout=timeout_seconds,
     )
     _raise_for_postman_error(resp)
@@ -216,76 +282,195 @@ def _request_json(
     if resp.status_code == 204:
         return {}
 
-    data: Any = resp.json()
+    # Parse the raw bytes: no intermediate decoded copy of (possibly multi-MB) collection bodies
+    data: Any = json_loads(resp.content)
     if not isinstance(data, dict):
         raise PostmanApiError(f"Unexpected response shape from {method} {path}")
     return cast(dict[str, Any], data)
 
 
-def get_workspace_assets(base_url: str, api_key: str, workspace_id: str) -> PostmanWorkspaceAssets:
+def _fetch_collection_api_id(base_url: str, api_key: str, uid: str) -> Optional[str]:
+    """Fetch a collection to read its x-api-id (empty string if missing, None on error)."""
+    try:
+        coll_data = _request_json("GET", base_url, f"/collections/{uid}", api_key)
+    except Exception:
+        # Silently ignore errors fetching individual collections
+        return None
+    coll_obj_raw: Any = coll_data.get("collection", {})
+    coll_obj = cast(dict[str, Any], coll_obj_raw) if isinstance(coll_obj_raw, dict) else {}
+    info_raw: Any = coll_obj.get("info", {})
+    info = cast(dict[str, Any], info_raw) if isinstance(info_raw, dict) else {}
+    return str(info.get("x-api-id", "")).strip()
+
+
+def _fetch_environment_api_id(base_url: str, api_key: str, uid: str) -> Optional[str]:
+    """Fetch an environment to read its x-api-id (empty string if missing, None on error)."""
+    try:
+        env_data = _request_json("GET", base_url, f"/environments/{uid}", api_key)
+    except Exception:
+        # Silently ignore errors fetching individual environments
+        return None
+    env_obj_raw: Any = env_data.get("environment", {})
+    env_obj = cast(dict[str, Any], env_obj_raw) if isinstance(env_obj_raw, dict) else {}
+    return str(env_obj.get("x-api-id", "")).strip()
+
+
+def _fetch_api_id(base_url: str, api_key: str, key: str) -> Optional[str]:
+    """Fetch the x-api-id of the asset identified by "collections/<uid>" or "environments/<uid>"."""
+    kind, _, uid = key.partition("/")
+    if kind == "collections":
+        return _fetch_collection_api_id(base_url, api_key, uid)
+    return _fetch_environment_api_id(base_url, api_key, uid)
+
+
+def _load_cache(path: str, ttl: int) -> dict[str, str]:
+    """Load the entries of a local cache file that are fresher than ttl seconds."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            cached = json.load(f)
+        now = time.time()
+        return {key: str(value) for key, (ts, value) in cached.items() if now - ts < ttl}
+    except Exception:
+        # Missing or unreadable cache: everything is fetched
+        return {}
+
+
+def _save_cache(path: str, entries: dict[str, Optional[str]], ttl: int) -> None:
+    """Add entries to a local cache file (None removes the key), dropping the expired ones (best effort)."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            cache = json.load(f)
+    except Exception:
+        cache = {}
+
+    now = time.time()
+    cache = {key: entry for key, entry in cache.items() if now - entry[0] < ttl}
+    for key, value in entries.items():
+        if value is None:
+            cache.pop(key, None)
+        else:
+            cache[key] = [now, value]
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+    except OSError:
+        pass
+
+
+def _payload_digest(payload: dict[str, Any]) -> str:
+    """SHA-256 of the payload as it is sent to the API."""
+    serialized = json_dumps(payload)
+    return hashlib.sha256(serialized if isinstance(serialized, bytes) else serialized.encode()).hexdigest()
+
+
+def _put_unless_unchanged(
+    base_url: str, api_key: str, path: str, payload: dict[str, Any], skip_unchanged_ttl: int
+) -> bool:
+    """PUT the payload, unless the very same one was deployed to path less than skip_unchanged_ttl seconds ago.
+
+    Returns whether the PUT was sent.
+    """
+    if skip_unchanged_ttl <= 0:
+        _request_json("PUT", base_url, path, api_key, payload=payload)
+        return True
+
+    digest = _payload_digest(payload)
+    if _load_cache(PAYLOAD_HASHES_CACHE_PATH, skip_unchanged_ttl).get(path) == digest:
+        return False
+    try:
+        _request_json("PUT", base_url, path, api_key, payload=payload)
+    except Exception:
+        # The remote state is unknown now
+        _save_cache(PAYLOAD_HASHES_CACHE_PATH, {path: None}, skip_unchanged_ttl)
+        raise
+    _save_cache(PAYLOAD_HASHES_CACHE_PATH, {path: digest}, skip_unchanged_ttl)
+    return True
+
+
+def _extract_name_uid(a_raw: Any) -> Optional[tuple[str, str]]:
+    """Extract the (name, uid) of a workspace listing entry, None if it lacks either."""
+    if not isinstance(a_raw, dict):
+        return None
+    a = cast(dict[str, Any], a_raw)
+    name = str(a.get("name", "")).strip()
+    uid = str(a.get("uid", "")).strip() or str(a.get("id", "")).strip()
+    return (name, uid) if name and uid else None
+
+
+def _names_and_uids(assets_raw: Any) -> list[tuple[str, str]]:
+    """Extract the (name, uid) pairs of a workspace's collection/environment listing."""
+    if not isinstance(assets_raw, list):
+        return []
+    return [pair for pair in map(_extract_name_uid, cast(list[Any], assets_raw)) if pair]
+
+
+def _index_assets(
+    kind: str,
+    pairs: list[tuple[str, str]],
+    api_ids: dict[str, Optional[str]],
+) -> tuple[dict[str, str], dict[str, str], dict[str, str]]:
+    """Index (name, uid) pairs by name, by x-api-id and by base name (first asset wins) in a single pass."""
+    by_name: dict[str, str] = {}
+    by_api_id: dict[str, str] = {}
+    by_base_name: dict[str, str] = {}
+    for name, uid in pairs:
+        by_name[name] = uid
+        by_base_name.setdefault(_strip_version_from_name(name), uid)
+        api_id = api_ids.get(f"{kind}/{uid}")
+        if api_id:
+            by_api_id[api_id] = uid
+    return by_name, by_api_id, by_base_name
+
+
+def get_workspace_assets(
+    base_url: str,
+    api_key: str,
+    workspace_id: str,
+    *,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    include_api_ids: bool = True,
+    cache_ttl: int = 0,
+) -> PostmanWorkspaceAssets:
     # Workspaces API returns collection/env identifiers that are in that workspace.
     data = _request_json("GET", base_url, f"/workspaces/{workspace_id}", api_key)
     workspace_raw: Any = data.get("workspace", {})
     workspace = cast(dict[str, Any], workspace_raw) if isinstance(workspace_raw, dict) else {}
 
-    collections_by_name: dict[str, str] = {}
-    collections_by_api_id: dict[str, str] = {}
-    envs_by_name: dict[str, str] = {}
-    envs_by_api_id: dict[str, str] = {}
-
-    collections_raw: Any = workspace.get("collections", [])
-    if isinstance(collections_raw, list):
-        collections_list = cast(list[Any], collections_raw)
-        for c_raw in collections_list:
-            if not isinstance(c_raw, dict):
-                continue
-            c = cast(dict[str, Any], c_raw)
-            name = str(c.get("name", "")).strip()
-            uid = str(c.get("uid", "")).strip() or str(c.get("id", "")).strip()
-            if name and uid:
-                collections_by_name[name] = uid
-                # Fetch full collection to get x-api-id
-                try:
-                    coll_data = _request_json("GET", base_url, f"/collections/{uid}", api_key)
-                    coll_obj_raw: Any = coll_data.get("collection", {})
-                    coll_obj = cast(dict[str, Any], coll_obj_raw) if isinstance(coll_obj_raw, dict) else {}
-                    info_raw: Any = coll_obj.get("info", {})
-                    info = cast(dict[str, Any], info_raw) if isinstance(info_raw, dict) else {}
-                    api_id = str(info.get("x-api-id", "")).strip()
-                    if api_id:
-                        collections_by_api_id[api_id] = uid
-                except Exception:
-                    # Silently ignore errors fetching individual collections
-                    pass
-
-    envs_raw: Any = workspace.get("environments", [])
-    if isinstance(envs_raw, list):
-        envs_list = cast(list[Any], envs_raw)
-        for e_raw in envs_list:
-            if not isinstance(e_raw, dict):
-                continue
-            e = cast(dict[str, Any], e_raw)
-            name = str(e.get("name", "")).strip()
-            uid = str(e.get("uid", "")).strip() or str(e.get("id", "")).strip()
-            if name and uid:
-                envs_by_name[name] = uid
-                # Fetch full environment to get x-api-id
-                try:
-                    env_data = _request_json("GET", base_url, f"/environments/{uid}", api_key)
-                    env_obj_raw: Any = env_data.get("environment", {})
-                    env_obj = cast(dict[str, Any], env_obj_raw) if isinstance(env_obj_raw, dict) else {}
-                    api_id = str(env_obj.get("x-api-id", "")).strip()
-                    if api_id:
-                        envs_by_api_id[api_id] = uid
-                except Exception:
-                    # Silently ignore errors fetching individual environments
-                    pass
-
+    collections = _names_and_uids(workspace.get("collections", []))
+    envs = _names_and_uids(workspace.get("environments", []))
+
+    # The listing doesn't include x-api-id: fetch every asset, a bounded number at a time,
+    # unless the caller only matches by name or it was looked up less than cache_ttl seconds ago
+    api_ids: dict[str, Optional[str]] = {}
+    if include_api_ids:
+        api_ids.update(_load_cache(API_IDS_CACHE_PATH, cache_ttl) if cache_ttl > 0 else {})
+        keys = [f"collections/{uid}" for _, uid in collections] + [f"environments/{uid}" for _, uid in envs]
+        missing = [key for key in keys if key not in api_ids]
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+            fetched = dict(zip(missing, executor.map(lambda key: _fetch_api_id(base_url, api_key, key), missing)))
+        api_ids.update(fetched)
+        if cache_ttl > 0 and fetched:
+            # Failed lookups (None) are retried next time
+            _save_cache(
+                API_IDS_CACHE_PATH,
+                {key: api_id for key, api_id in fetched.items() if api_id is not None},
+                cache_ttl,
+            )
+
+    collections_by_name, collections_by_api_id, collections_by_base_name = _index_assets(
+        "collections", collections, api_ids
+    )
+    environments_by_name, environments_by_api_id, environments_by_base_name = _index_assets(
+        "environments", envs, api_ids
+    )
     return PostmanWorkspaceAssets(
         collections_by_name=collections_by_name,
         collections_by_api_id=collections_by_api_id,
-        environments_by_name=envs_by_name,
-        environments_by_api_id=envs_by_api_id
+        environments_by_name=environments_by_name,
+        environments_by_api_id=environments_by_api_id,
+        collections_by_base_name=collections_by_base_name,
+        environments_by_base_name=environments_by_base_name,
     )
 
 
@@ -294,10 +479,22 @@ def upsert_collection(
     api_key: str,
     workspace_id: str,
     collection_export: dict[str, Any],
+    *,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    assets: Optional[PostmanWorkspaceAssets] = None,
+    skip_unchanged_ttl: int = 0,
 ) -> tuple[str, str]:
+    """Create or overwrite a collection.
+
+    Pass the workspace assets to reuse them across several upserts, they are kept
+    up to date with the collections created here. With a positive skip_unchanged_ttl,
+    a collection deployed from here with the same content less than skip_unchanged_ttl
+    seconds ago is left "unchanged" (even if it was edited in Postman since).
+    """
     api_id = _collection_api_id_from_export(collection_export)
     name = _collection_name_from_export(collection_export)
-    assets = get_workspace_assets(base_url, api_key, workspace_id)
+    if assets is None:
+        assets = get_workspace_assets(base_url, api_key, workspace_id, concurrency=concurrency)
 
     # Try to find existing collection by:
     # 1. x-api-id (exact match)
@@ -306,12 +503,15 @@ def upsert_collection(
     existing_uid = (
         assets.collections_by_api_id.get(api_id) or 
         assets.collections_by_name.get(name) or
-        _find_uid_by_base_name(name, assets.collections_by_name)
+        _find_uid_by_base_name(name, assets.collections_by_base_name)
     )
     payload = _wrap_collection_for_api(collection_export)
 
     if existing_uid:
-        _request_json("PUT", base_url, f"/collections/{existing_uid}", api_key, payload=payload)
+        if not _put_unless_unchanged(
+            base_url, api_key, f"/collections/{existing_uid}", payload, skip_unchanged_ttl
+        ):
+            return ("unchanged", existing_uid)
         return ("updated", existing_uid)
 
     created = _request_json(
@@ -325,6 +525,14 @@ def upsert_collection(
     collection_obj_raw: Any = created.get("collection", {})
     collection_obj = cast(dict[str, Any], collection_obj_raw) if isinstance(collection_obj_raw, dict) else {}
     uid = str(collection_obj.get("uid", "")).strip() or str(collection_obj.get("id", "")).strip()
+    if uid:
+        assets.collections_by_name[name] = uid
+        assets.collections_by_api_id[api_id] = uid
+        assets.collections_by_base_name.setdefault(_strip_version_from_name(name), uid)
+        if skip_unchanged_ttl > 0:
+            _save_cache(
+                PAYLOAD_HASHES_CACHE_PATH, {f"/collections/{uid}": _payload_digest(payload)}, skip_unchanged_ttl
+            )
     return ("created", uid or "")
 
 
@@ -333,10 +541,22 @@ def upsert_environment(
     api_key: str,
     workspace_id: str,
     env_export: dict[str, Any],
+    *,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    assets: Optional[PostmanWorkspaceAssets] = None,
+    skip_unchanged_ttl: int = 0,
 ) -> tuple[str, str, str]:
+    """Create or overwrite an environment.
+
+    Pass the workspace assets to reuse them across several upserts, they are kept
+    up to date with the environments created here. With a positive skip_unchanged_ttl,
+    an environment deployed from here with the same content less than skip_unchanged_ttl
+    seconds ago is left "unchanged" (even if it was edited in Postman since).
+    """
     api_id = _environment_api_id_from_export(env_export)
     name = _environment_name_from_export(env_export)
-    assets = get_workspace_assets(base_url, api_key, workspace_id)
+    if assets is None:
+        assets = get_workspace_assets(base_url, api_key, workspace_id, concurrency=concurrency)
 
     # Try to find existing environment by:
     # 1. x-api-id (exact match)
@@ -345,12 +565,15 @@ def upsert_environment(
     existing_uid = (
         assets.environments_by_api_id.get(api_id) or 
         assets.environments_by_name.get(name) or
-        _find_uid_by_base_name(name, assets.environments_by_name)
+        _find_uid_by_base_name(name, assets.environments_by_base_name)
     )
     payload = _wrap_environment_for_api(env_export)
 
     if existing_uid:
-        _request_json("PUT", base_url, f"/environments/{existing_uid}", api_key, payload=payload)
+        if not _put_unless_unchanged(
+            base_url, api_key, f"/environments/{existing_uid}", payload, skip_unchanged_ttl
+        ):
+            return ("unchanged", name, existing_uid)
         return ("updated", name, existing_uid)
 
     created = _request_json(
@@ -364,6 +587,14 @@ def upsert_environment(
     env_obj_raw: Any = created.get("environment", {})
     env_obj = cast(dict[str, Any], env_obj_raw) if isinstance(env_obj_raw, dict) else {}
     uid = str(env_obj.get("uid", "")).strip() or str(env_obj.get("id", "")).strip()
+    if uid:
+        assets.environments_by_name[name] = uid
+        assets.environments_by_api_id[api_id] = uid
+        assets.environments_by_base_name.setdefault(_strip_version_from_name(name), uid)
+        if skip_unchanged_ttl > 0:
+            _save_cache(
+                PAYLOAD_HASHES_CACHE_PATH, {f"/environments/{uid}": _payload_digest(payload)}, skip_unchanged_ttl
+            )
     return ("created", name, uid or "")
 
 
@@ -396,8 +627,38 @@ def main(argv: Optional[list[str]] = None) -> int:
         default=DEFAULT_TIMEOUT_SECONDS,
         help=f"HTTP timeout in seconds (default: {DEFAULT_TIMEOUT_SECONDS})",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Max simultaneous Postman API requests (default: {DEFAULT_CONCURRENCY})",
+    )
+    parser.add_argument(
+        "--cache-ttl",
+        type=int,
+        default=DEFAULT_CACHE_TTL,
+        help=(
+            "Seconds the x-api-ids of workspace assets are reused from the local cache "
+            f"(default: {DEFAULT_CACHE_TTL})"
+        ),
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always fetch the x-api-ids of workspace assets from the API",
+    )
+    parser.add_argument(
+        "--skip-unchanged-ttl",
+        type=int,
+        default=0,
+        help=(
+            "Don't upload a collection/environment deployed from here with the same content less than this "
+            "many seconds ago, even if it was edited in Postman since (default: 0, always upload)"
+        ),
+    )
 
     args = parser.parse_args(argv)
+    _size_session_pool(args.concurrency)
 
     api_key = str(args.api_key or os.getenv("POSTMAN_API_KEY") or "").strip()
     if not api_key:
@@ -415,15 +676,36 @@ def main(argv: Optional[list[str]] = None) -> int:
     base_url = str(args.api_base_url)
     workspace_id = str(args.workspace_id)
 
+    cache_ttl = 0 if args.no_cache else int(args.cache_ttl)
+
+    # The workspace contents are read once and shared by every upsert of this run
+    assets = get_workspace_assets(
+        base_url, api_key, workspace_id, concurrency=args.concurrency, cache_ttl=cache_ttl
+    )
+
     # Collection
     collection_export = _load_json_file(collection_path)
-    action, uid = upsert_collection(base_url, api_key, workspace_id, collection_export)
+    action, uid = upsert_collection(
+        base_url,
+        api_key,
+        workspace_id,
+        collection_export,
+        assets=assets,
+        skip_unchanged_ttl=args.skip_unchanged_ttl,
+    )
     print(f"✅ Collection {action}: {collection_path.name} ({uid})")
 
     # Environments
     for env_path in env_paths:
         env_export = _load_json_file(env_path)
-        env_action, env_name, env_uid = upsert_environment(base_url, api_key, workspace_id, env_export)
+        env_action, env_name, env_uid = upsert_environment(
+            base_url,
+            api_key,
+            workspace_id,
+            env_export,
+            assets=assets,
+            skip_unchanged_ttl=args.skip_unchanged_ttl,
+        )
         print(f"✅ Environment {env_action}: {env_name} ({env_uid})")
 
     return 0
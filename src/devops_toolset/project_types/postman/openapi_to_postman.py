@@ -5,13 +5,16 @@ This module converts OpenAPI 3.0 specifications (YAML or JSON) to Postman Collec
 It also generates environment files for different deployment environments.
 """
 
+import hashlib
 import json
-import yaml
-from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+import marshal
+import sys
+from datetime import date, datetime, timezone
 from collections.abc import Mapping, Sequence
 from typing import Any, Optional, cast
 from pathlib import Path
-import urllib.request
+import requests
 import re
 from urllib.parse import urlparse, urlunparse
 
@@ -34,11 +37,219 @@ except ImportError:  # pragma: no cover
         validate_openapi_version,
     )
 
+# orjson parses specs and writes the (large) collection and environment files considerably faster,
+# json is the fallback
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+# Timeout (seconds) when downloading a spec from a URL
+DOWNLOAD_TIMEOUT_SECONDS = 60
+
+# Parsed YAML specs by SHA-256 of their content, so an unchanged spec is parsed only once. Stored with
+# marshal, which (unlike pickle) can't run code when loaded and (unlike JSON) keeps YAML's non-string keys
+# (e.g. 200 response codes); dates are stored as tagged tuples, a type the safe YAML loader never produces
+SPEC_CACHE_DIR = Path.home() / ".cache" / "devops-toolset" / "openapi"
+# Parsed specs kept in the cache, the least recently used ones are removed beyond this
+SPEC_CACHE_MAX_ENTRIES = 32
+
+# Max threads used to write environment files
+MAX_WORKERS = 8
+
+# Fixed parts of the collection file layout (same as json.dump(indent=2)), between which the info object,
+# the auth folder and the endpoint folders are written as they are serialized
+_COLLECTION_PREFIX = b'{\n  "info": '
+_COLLECTION_ITEMS_START = b',\n  "item": [\n    '
+_FOLDER_START = b',\n    {\n      "name": '
+_FOLDER_ITEMS_START = b',\n      "item": ['
+_FOLDER_ITEM_SEPARATOR = b'\n        '
+_FOLDER_END = b'\n      ]\n    }'
+_COLLECTION_SUFFIX = b'\n  ]\n}'
+
+# Buffer (bytes) of the collection file, which is written folder by folder: a large buffer turns the
+# many small writes into a few large ones
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Start of a JSON object, used to tell JSON specs from YAML ones without a failed parse attempt
+_JSON_OBJECT_START_RE = re.compile(rb'\s*\{')
+
+# Operations converted to requests, in the order they are added to their folder
+HTTP_METHODS = ('get', 'post', 'put', 'delete', 'patch', 'options', 'head')
+
+
+def _loads_json(content: bytes) -> Any:
+    """Parse JSON straight from bytes (raises json.JSONDecodeError, orjson's error is a subclass)."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _to_marshal_tree(node: Any, memo: dict[int, Any]) -> Any:
+    """Copy a parsed YAML tree replacing dates with tagged tuples (shared nodes, i.e. YAML aliases, stay shared)."""
+    if isinstance(node, datetime):
+        return ('datetime', node.isoformat())
+    if isinstance(node, date):
+        return ('date', node.isoformat())
+    if not isinstance(node, (dict, list, set)):
+        return node
+    if id(node) in memo:
+        return memo[id(node)]
+    if isinstance(node, dict):
+        copy: Any = {}
+        memo[id(node)] = copy
+        for key, value in node.items():
+            copy[_to_marshal_tree(key, memo)] = _to_marshal_tree(value, memo)
+    elif isinstance(node, list):
+        copy = memo[id(node)] = []
+        copy.extend(_to_marshal_tree(item, memo) for item in node)
+    else:
+        copy = memo[id(node)] = {_to_marshal_tree(item, memo) for item in node}
+    return copy
+
+
+def _from_marshal_tree(node: Any, memo: dict[int, Any]) -> Any:
+    """Inverse of _to_marshal_tree."""
+    if isinstance(node, tuple):
+        tag, value = node
+        return datetime.fromisoformat(value) if tag == 'datetime' else date.fromisoformat(value)
+    if not isinstance(node, (dict, list, set)):
+        return node
+    if id(node) in memo:
+        return memo[id(node)]
+    if isinstance(node, dict):
+        copy: Any = {}
+        memo[id(node)] = copy
+        for key, value in node.items():
+            copy[_from_marshal_tree(key, memo)] = _from_marshal_tree(value, memo)
+    elif isinstance(node, list):
+        copy = memo[id(node)] = []
+        copy.extend(_from_marshal_tree(item, memo) for item in node)
+    else:
+        copy = memo[id(node)] = {_from_marshal_tree(item, memo) for item in node}
+    return copy
+
+
+def _prune_spec_cache() -> None:
+    """Remove the least recently used parsed specs beyond SPEC_CACHE_MAX_ENTRIES (and any old pickled ones)."""
+    try:
+        entries = sorted(
+            SPEC_CACHE_DIR.glob('*.marshal'), key=lambda entry: entry.stat().st_mtime, reverse=True
+        )
+        for entry in [*entries[SPEC_CACHE_MAX_ENTRIES:], *SPEC_CACHE_DIR.glob('*.pickle')]:
+            entry.unlink()
+    except OSError:
+        pass
+
+
+def _load_yaml(content: bytes) -> Any:
+    """Parse a YAML spec, reusing the result of a previous run for the very same content."""
+    cache_path = SPEC_CACHE_DIR / f"{hashlib.sha256(content).hexdigest()}.v{marshal.version}.marshal"
+    try:
+        spec = _from_marshal_tree(marshal.loads(cache_path.read_bytes()), {})
+    except OSError:
+        # Not cached yet
+        pass
+    except (EOFError, ValueError, TypeError):
+        # Truncated or not written by this module: parse it again
+        pass
+    else:
+        try:
+            # Mark it as recently used
+            cache_path.touch()
+        except OSError:
+            pass
+        return spec
+
+    # Imported here so JSON-only runs never pay for loading PyYAML
+    import yaml
+
+    # libyaml's loader parses large specs an order of magnitude faster, when PyYAML was built with it
+    spec = yaml.load(content, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+    try:
+        SPEC_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        cache_path.write_bytes(marshal.dumps(_to_marshal_tree(spec, {})))
+    except (OSError, ValueError):
+        # Not writable, or a value marshal can't store: just don't cache it
+        pass
+    else:
+        _prune_spec_cache()
+    return spec
+
+
+def _parse_unknown_spec(content: bytes) -> Any:
+    """Parse a spec of unknown format: a JSON spec is an object, anything else can only be YAML."""
+    if _JSON_OBJECT_START_RE.match(content):
+        try:
+            return _loads_json(content)
+        except json.JSONDecodeError:
+            # YAML flow mapping, e.g. with unquoted keys
+            pass
+    return _load_yaml(content)
+
+
+def _dumps_json(data: Any, level: int = 0) -> bytes:
+    """Serialize data as UTF-8 JSON indented with 2 spaces, as if nested level objects deep in a document."""
+    if orjson is not None:
+        # OPT_NON_STR_KEYS: YAML specs can have non-string keys (e.g. 200 response codes)
+        serialized = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        serialized = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    # Newlines in JSON strings are escaped, so every raw one starts a line to indent
+    return serialized.replace(b'\n', b'\n' + b'  ' * level) if level else serialized
+
+
+def _download_spec(url: str) -> bytes:
+    """Download a spec, reusing the copy downloaded last time if the server reports it unchanged."""
+    cache_key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+    body_path = SPEC_CACHE_DIR / f"{cache_key}.body"
+    meta_path = SPEC_CACHE_DIR / f"{cache_key}.meta.json"
+
+    headers: dict[str, str] = {}
+    try:
+        if body_path.exists():
+            meta = json.loads(meta_path.read_bytes())
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                headers['If-Modified-Since'] = meta['last_modified']
+    except Exception:
+        # No usable validators: download it in full
+        headers = {}
+
+    # requests asks for gzip/deflate and decompresses transparently
+    response = requests.get(url, headers=headers, timeout=DOWNLOAD_TIMEOUT_SECONDS)
+    if response.status_code == 304:
+        return body_path.read_bytes()
+    response.raise_for_status()
+
+    content = response.content
+    validators = {'etag': response.headers.get('ETag'), 'last_modified': response.headers.get('Last-Modified')}
+    if any(validators.values()):
+        try:
+            SPEC_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            body_path.write_bytes(content)
+            meta_path.write_text(json.dumps(validators), encoding='utf-8')
+        except OSError:
+            pass
+    return content
+
+
+def _write_json_file(file_path: Path, data: Any) -> None:
+    """Write data as UTF-8 JSON indented with 2 spaces."""
+    file_path.write_bytes(_dumps_json(data))
+
 
 class OpenAPIToPostmanConverter:
     """Converts OpenAPI specifications to Postman collections and environment files."""
 
-    def __init__(self, openapi_source: str, output_folder: str, environments: Optional[list[str]] = None):
+    def __init__(
+        self,
+        openapi_source: str,
+        output_folder: str,
+        environments: Optional[list[str]] = None,
+        verbose: bool = True,
+    ):
         """
         Initialize the converter.
 
@@ -46,16 +257,29 @@ class OpenAPIToPostmanConverter:
             openapi_source: Path to OpenAPI file or URL
             output_folder: Directory where generated files will be saved
             environments: Optional list of environment names. If not provided, will be read from x-postman-environments in OpenAPI spec
+            verbose: If False, progress messages are not printed
         """
         self.openapi_source = openapi_source
+        self.verbose = verbose
         self.output_folder = Path(output_folder)
         self.environments: Optional[list[str]] = environments  # Will be set from OpenAPI if None
         self.global_vars: dict[str, str] = {}  # Global variables from _global section
         self.openapi_spec: dict[str, Any] = {}
         self.api_version: str = "1.0.0"
         self.api_title: str = "API"
-        self.generated_at_iso: str = datetime.now(timezone.utc).isoformat()
+        # One generation time for the whole run, so the collection and environment files share it
+        self.generated_at: datetime = datetime.now(timezone.utc)
+        self.generated_at_iso: str = self.generated_at.isoformat()
+        self.file_timestamp: str = self.generated_at.strftime('%Y%m%d_%H%M%S')
         self.api_id_slug: str = ""  # Stable API identifier (without version)
+        self.version_display: str = ""  # api_version with a single leading 'v'
+        self.name_base: str = ""  # "<title> v<version>", prefix of every generated name
+        self.filename_base: str = ""  # name_base sanitized for file names
+        # Raw JSON bodies by id() of their example, as many operations share the same component example.
+        # The example is kept alongside, so its id() can't be reused by another object
+        self._body_raw_cache: dict[int, tuple[Any, str]] = {}
+        # Targets of local "$ref" pointers, resolved once per pointer
+        self._ref_cache: dict[str, Any] = {}
         
         # Ensure output folder exists
         self.output_folder.mkdir(parents=True, exist_ok=True)
@@ -92,35 +316,32 @@ class OpenAPIToPostmanConverter:
         try:
             # Check if source is a URL
             if is_url(self.openapi_source) or self.openapi_source.startswith(('http://', 'https://')):
-                print(f"Downloading OpenAPI spec from: {self.openapi_source}")
-                with urllib.request.urlopen(self.openapi_source) as response:
-                    content = response.read().decode('utf-8')
-                    # Try JSON first, then YAML
-                    try:
-                        self.openapi_spec = json.loads(content)
-                    except json.JSONDecodeError:
-                        self.openapi_spec = yaml.safe_load(content)
+                if self.verbose:
+                    print(f"Downloading OpenAPI spec from: {self.openapi_source}")
+                content = _download_spec(self.openapi_source)
+                if Path(urlparse(self.openapi_source).path).suffix.lower() in ['.yaml', '.yml']:
+                    self.openapi_spec = _load_yaml(content)
+                else:
+                    self.openapi_spec = _parse_unknown_spec(content)
             else:
                 # Load from local file
                 file_path = Path(self.openapi_source)
                 if not file_path.exists():
                     raise FileNotFoundError(f"OpenAPI file not found: {self.openapi_source}")
-                
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    
+
                 # Detect format by extension or content
+                content = file_path.read_bytes()
                 if file_path.suffix.lower() in ['.yaml', '.yml']:
-                    self.openapi_spec = yaml.safe_load(content)
+                    self.openapi_spec = _load_yaml(content)
                 elif file_path.suffix.lower() == '.json':
-                    self.openapi_spec = json.loads(content)
+                    self.openapi_spec = _loads_json(content)
                 else:
-                    # Try to auto-detect
-                    try:
-                        self.openapi_spec = json.loads(content)
-                    except json.JSONDecodeError:
-                        self.openapi_spec = yaml.safe_load(content)
+                    # Auto-detect
+                    self.openapi_spec = _parse_unknown_spec(content)
             
+            # References resolved against a previously loaded spec no longer apply
+            self._ref_cache.clear()
+
             # Extract API information
             info = self.openapi_spec.get('info', {})
             self.api_version = info.get('version', '1.0.0')
@@ -139,7 +360,9 @@ class OpenAPIToPostmanConverter:
             
             # Determine version display with prefix (avoiding double 'v')
             version_prefix = '' if self.api_version.startswith('v') else 'v'
-            version_display = f"{version_prefix}{self.api_version}"
+            self.version_display = f"{version_prefix}{self.api_version}"
+            self.name_base = f"{self.api_title} {self.version_display}"
+            self.filename_base = sanitize_filename(self.name_base)
             
             # If environments not provided, read from x-postman-environments
             if self.environments is None:
@@ -191,10 +414,11 @@ class OpenAPIToPostmanConverter:
                     )
                 
                 self.environments = env_list
-                print(f"Loaded OpenAPI spec: {self.api_title} {version_display}")
-                if self.global_vars:
-                    print(f"Detected global variables: {', '.join(self.global_vars.keys())}")
-                print(f"Detected environments from x-postman-environments: {', '.join(self.environments)}")
+                if self.verbose:
+                    print(f"Loaded OpenAPI spec: {self.name_base}")
+                    if self.global_vars:
+                        print(f"Detected global variables: {', '.join(self.global_vars.keys())}")
+                    print(f"Detected environments from x-postman-environments: {', '.join(self.environments)}")
                 
                 # Validate environment consistency (excluding _global)
                 envs_without_global: dict[str, dict[str, str]] = {
@@ -202,9 +426,10 @@ class OpenAPIToPostmanConverter:
                 }
                 self._validate_environment_consistency(envs_without_global)
             else:
-                print(f"Loaded OpenAPI spec: {self.api_title} {version_display}")
                 assert self.environments is not None
-                print(f"Using provided environments: {', '.join(self.environments)}")
+                if self.verbose:
+                    print(f"Loaded OpenAPI spec: {self.name_base}")
+                    print(f"Using provided environments: {', '.join(self.environments)}")
             
         except Exception as e:
             raise Exception(f"Error loading OpenAPI specification: {str(e)}")
@@ -244,7 +469,8 @@ class OpenAPIToPostmanConverter:
             error_msg += f"\n\nAll environments must have the same keys. Expected keys: {', '.join(sorted(all_keys))}"
             raise Exception(error_msg)
         
-        print(f"✅ Environment validation passed: All environments have consistent keys ({', '.join(sorted(all_keys))})")
+        if self.verbose:
+            print(f"✅ Environment validation passed: All environments have consistent keys ({', '.join(sorted(all_keys))})")
 
     def _get_base_url(self) -> str:
         """
@@ -313,29 +539,59 @@ class OpenAPIToPostmanConverter:
         Returns:
             Dictionary with 'query', 'header', and 'path' parameter lists
         """
-        result: dict[str, list[dict[str, Any]]] = {
-            'query': [],
-            'header': [],
-            'path': []
-        }
+        query: list[dict[str, Any]] = []
+        header: list[dict[str, Any]] = []
+        path: list[dict[str, Any]] = []
+        buckets = {'query': query, 'header': header, 'path': path}
         
         for param in parameters:
-            # Skip $ref parameters (not resolved here)
+            # Skip $ref parameters (not resolved here) and unsupported locations (e.g. cookie)
             if '$ref' in param:
                 continue
+            bucket = buckets.get(str(param.get('in', 'query')))
+            if bucket is None:
+                continue
 
-            param_in = str(param.get('in', 'query'))
-            postman_param: dict[str, Any] = {
+            bucket.append({
                 'key': str(param.get('name', '')),
                 'value': '',
                 'description': str(param.get('description', '')),
                 'disabled': not param.get('required', False)
-            }
-            
-            if param_in in result:
-                result[param_in].append(postman_param)
+            })
         
-        return result
+        return {'query': query, 'header': header, 'path': path}
+
+    def _deref(self, node: Any) -> Any:
+        """
+        Resolve a local reference object (e.g. {"$ref": "#/components/requestBodies/Pet"}).
+        
+        Args:
+            node: Any spec node
+            
+        Returns:
+            The referenced node (following chained references), or the node itself if it isn't a local
+            reference or the reference can't be resolved
+        """
+        seen: set[str] = set()
+        while isinstance(node, dict) and isinstance(node.get('$ref'), str):
+            ref: str = node['$ref']
+            if not ref.startswith('#/') or ref in seen:
+                break
+            seen.add(ref)
+            if ref not in self._ref_cache:
+                target: Any = self.openapi_spec
+                for token in ref[2:].split('/'):
+                    token = token.replace('~1', '/').replace('~0', '~')
+                    if not isinstance(target, dict) or token not in target:
+                        target = None
+                        break
+                    target = target[token]
+                self._ref_cache[ref] = target
+            target = self._ref_cache[ref]
+            if target is None:
+                break
+            node = target
+        return node
 
     def _convert_request_body(self, request_body: Optional[dict[str, Any]]) -> Optional[dict[str, Any]]:
         """
@@ -347,7 +603,8 @@ class OpenAPIToPostmanConverter:
         Returns:
             Postman body object or None
         """
-        if not request_body:
+        request_body = self._deref(request_body)
+        if not request_body or not isinstance(request_body, dict):
             return None
         
         content_raw: Any = request_body.get('content', {})
@@ -355,25 +612,30 @@ class OpenAPIToPostmanConverter:
         
         # Prefer JSON content
         if 'application/json' in content:
-            json_content_raw: Any = content.get('application/json')
+            json_content_raw: Any = self._deref(content.get('application/json'))
             json_content: dict[str, Any] = cast(dict[str, Any], json_content_raw) if isinstance(json_content_raw, dict) else {}
 
             example: Any = json_content.get('example')
             if example is None:
                 examples: Any = json_content.get('examples') or {}
                 if isinstance(examples, dict) and examples:
-                    first_example = next(iter(cast(dict[str, Any], examples).values()))
+                    first_example = self._deref(next(iter(cast(dict[str, Any], examples).values())))
                     if isinstance(first_example, dict) and 'value' in first_example:
                         example = first_example['value']
 
-            schema = json_content.get('schema', {})
             if example is None:
                 # Schema may not be a concrete example; use empty object by default
-                example = {} if isinstance(schema, dict) else {}
+                raw = '{}'
+            else:
+                cached = self._body_raw_cache.get(id(example))
+                if cached is None:
+                    cached = (example, _dumps_json(example).decode('utf-8'))
+                    self._body_raw_cache[id(example)] = cached
+                raw = cached[1]
             
             return {
                 'mode': 'raw',
-                'raw': json.dumps(example, indent=2, ensure_ascii=False),
+                'raw': raw,
                 'options': {
                     'raw': {
                         'language': 'json'
@@ -406,19 +668,29 @@ class OpenAPIToPostmanConverter:
         rest = ''.join(p[:1].upper() + p[1:] for p in parts[1:])
         return first + rest
 
-    def _security_headers_for_operation(self, operation: dict[str, Any]) -> list[dict[str, Any]]:
+    def _spec_security(self) -> tuple[Any, dict[str, Any]]:
+        """Return the spec-level security requirements and the security schemes they refer to."""
+        spec = self.openapi_spec or {}
+        schemes_raw: Any = spec.get('components', {}).get('securitySchemes', {})
+        schemes: dict[str, Any] = schemes_raw if isinstance(schemes_raw, dict) else {}
+        return spec.get('security', []), schemes
+
+    def _security_headers_for_operation(
+        self,
+        operation: dict[str, Any],
+        spec_security: Optional[tuple[Any, dict[str, Any]]] = None,
+    ) -> list[dict[str, Any]]:
         """Build Postman headers implied by OpenAPI security requirements."""
+        # Spec-level lookups can be resolved once by the caller and shared by all operations
+        default_security_reqs, schemes = spec_security if spec_security is not None else self._spec_security()
         security_reqs_raw: Any = operation.get('security')
         if security_reqs_raw is None:
-            security_reqs_raw = self.openapi_spec.get('security', []) if self.openapi_spec else []
+            security_reqs_raw = default_security_reqs
 
         security_reqs: list[dict[str, Any]] = []
         if isinstance(security_reqs_raw, list):
             security_reqs = [r for r in security_reqs_raw if isinstance(r, dict)]
 
-        schemes_raw: Any = (self.openapi_spec or {}).get('components', {}).get('securitySchemes', {})
-        schemes: dict[str, Any] = schemes_raw if isinstance(schemes_raw, dict) else {}
-
         used_scheme_names: set[str] = set()
         for req in security_reqs:
             used_scheme_names.update(str(k) for k in req.keys())
@@ -462,6 +734,7 @@ class OpenAPIToPostmanConverter:
         method: str,
         operation: dict[str, Any],
         parameters: Sequence[Mapping[str, Any]],
+        spec_security: Optional[tuple[Any, dict[str, Any]]] = None,
     ) -> dict[str, Any]:
         """
         Create a Postman request item from OpenAPI operation.
@@ -471,6 +744,7 @@ class OpenAPIToPostmanConverter:
             method: HTTP method (GET, POST, etc.)
             operation: OpenAPI operation object
             parameters: Merged parameter list (path-level + operation-level)
+            spec_security: Result of _spec_security() (looked up here if omitted)
             
         Returns:
             Postman request item
@@ -494,11 +768,20 @@ class OpenAPIToPostmanConverter:
             'query': param_dict['query'],
         }
         
+        # Name after the summary, the operationId or else the method and path (only formatted when needed)
+        method_upper = method.upper()
+        if 'summary' in operation:
+            name = operation['summary']
+        elif 'operationId' in operation:
+            name = operation['operationId']
+        else:
+            name = f"{method_upper} {path}"
+
         # Build request object
         request: dict[str, Any] = {
-            'name': operation.get('summary', operation.get('operationId', f"{method.upper()} {path}")),
+            'name': name,
             'request': {
-                'method': method.upper(),
+                'method': method_upper,
                 'header': param_dict['header'],
                 'url': url_obj,
                 'description': operation.get('description', '')
@@ -507,7 +790,7 @@ class OpenAPIToPostmanConverter:
 
         # Add security-derived headers (e.g., APIM subscription key, OAuth2 token)
         existing_header_keys = {str(h.get('key', '')).lower() for h in request['request'].get('header', []) if isinstance(h, dict)}
-        for hdr in self._security_headers_for_operation(operation):
+        for hdr in self._security_headers_for_operation(operation, spec_security):
             key_lower = str(hdr.get('key', '')).lower()
             if key_lower and key_lower not in existing_header_keys:
                 request['request']['header'].append(hdr)
@@ -601,8 +884,13 @@ class OpenAPIToPostmanConverter:
         if not self.openapi_spec:
             raise Exception("OpenAPI specification not loaded. Call load_openapi_spec() first.")
         
-        paths_raw: Any = self.openapi_spec.get('paths', {})
+        # Resolve spec-level lookups once instead of per path/operation
+        spec = self.openapi_spec
+        paths_raw: Any = spec.get('paths', {})
         paths: dict[str, Any] = cast(dict[str, Any], paths_raw) if isinstance(paths_raw, dict) else {}
+        info_raw: Any = spec.get('info', {})
+        info: dict[str, Any] = info_raw if isinstance(info_raw, dict) else {}
+        spec_security = self._spec_security()
         
         # Create authentication folder
         auth_folder: dict[str, Any] = {
@@ -611,68 +899,57 @@ class OpenAPIToPostmanConverter:
             'description': 'Authentication endpoints'
         }
         
-        # Determine collection name with version (avoiding double 'v' prefix)
-        version_prefix = '' if self.api_version.startswith('v') else 'v'
-        collection_name = f"{self.api_title} {version_prefix}{self.api_version}"
-        
-        # Create collection structure (all variables are in environment files)
-        collection: dict[str, Any] = {
-            'info': {
-                'name': collection_name,
-                'description': self.openapi_spec.get('info', {}).get('description', ''),
-                'schema': 'https://schema.getpostman.com/json/collection/v2.1.0/collection.json'
-            },
-            'item': [auth_folder]
+        # Collection info (all variables are in environment files)
+        info_obj: dict[str, Any] = {
+            'name': self.name_base,
+            'description': info.get('description', ''),
+            'schema': 'https://schema.getpostman.com/json/collection/v2.1.0/collection.json'
         }
         
-        # Group endpoints by tags or create flat structure
-        endpoint_folders: dict[str, list[dict[str, Any]]] = {}
+        # Group endpoints by tags or create flat structure. Requests are serialized as soon as they are
+        # created (at the depth they have in the collection file), so the whole collection is never held
+        # in memory as objects
+        endpoint_folders: dict[str, list[bytes]] = {}
+
+        # Hot loop (runs for every operation): callables are bound to locals and types are only annotated
+        # (typing.cast is a real call at runtime), so no time goes to attribute lookups and no-op calls
+        create_request = self._create_postman_request
+        folder_requests = endpoint_folders.setdefault
         
         for path, path_item in paths.items():
-            for method in ['get', 'post', 'put', 'delete', 'patch', 'options', 'head']:
-                if not isinstance(path_item, dict) or method not in path_item:
-                    continue
+            if not isinstance(path_item, dict):
+                continue
+            path_item_dict: dict[str, Any] = path_item
+
+            # Path-level parameters are shared by every operation of the path
+            path_level_params_raw: Any = path_item_dict.get('parameters', [])
+            path_level_params: list[dict[str, Any]] = (
+                [p for p in path_level_params_raw if isinstance(p, dict)]
+                if isinstance(path_level_params_raw, list)
+                else []
+            )
 
-                path_item_dict = cast(dict[str, Any], path_item)
+            for method in HTTP_METHODS:
                 operation_raw: Any = path_item_dict.get(method)
                 if not isinstance(operation_raw, dict):
                     continue
-                operation: dict[str, Any] = cast(dict[str, Any], operation_raw)
-
-                tags_raw: Any = operation.get('tags', ['Default'])
-                tags: list[str] = [str(t) for t in tags_raw] if isinstance(tags_raw, list) else ['Default']
-                tag: str = tags[0] if tags else 'Default'
-                    
-                if tag not in endpoint_folders:
-                    endpoint_folders[tag] = []
-                    
+                operation: dict[str, Any] = operation_raw
+
+                # Grouped under its first tag (only that one is needed)
+                tags_raw: Any = operation.get('tags')
+                tag: str = str(tags_raw[0]) if isinstance(tags_raw, list) and tags_raw else 'Default'
+
                 # Merge path-level and operation-level parameters
-                path_level_params_raw: Any = path_item_dict.get('parameters', [])
                 operation_params_raw: Any = operation.get('parameters', [])
-                path_level_params = (
-                    [cast(dict[str, Any], p) for p in path_level_params_raw if isinstance(p, dict)]
-                    if isinstance(path_level_params_raw, list)
-                    else []
-                )
-                operation_params = (
-                    [cast(dict[str, Any], p) for p in operation_params_raw if isinstance(p, dict)]
+                operation_params: list[dict[str, Any]] = (
+                    [p for p in operation_params_raw if isinstance(p, dict)]
                     if isinstance(operation_params_raw, list)
                     else []
                 )
-                merged_params = merge_parameters(
-                    cast(list[dict[str, Any]], path_level_params),
-                    cast(list[dict[str, Any]], operation_params),
-                )
+                merged_params = merge_parameters(path_level_params, operation_params)
 
-                request_item = self._create_postman_request(path, method, operation, merged_params)
-                endpoint_folders[tag].append(request_item)
-        
-        # Add folders to collection
-        for folder_name, requests in endpoint_folders.items():
-            collection['item'].append({
-                'name': folder_name,
-                'item': requests
-            })
+                request_item = create_request(path, method, operation, merged_params, spec_security)
+                folder_requests(tag, []).append(_dumps_json(request_item, 4))
 
         # Prepend a human-readable generation timestamp (GMT) to the collection description.
         def _ordinal_suffix(day: int) -> str:
@@ -680,31 +957,153 @@ class OpenAPIToPostmanConverter:
                 return 'th'
             return {1: 'st', 2: 'nd', 3: 'rd'}.get(day % 10, 'th')
 
-        generated_at = datetime.now(timezone.utc)
+        generated_at = self.generated_at
         human_timestamp = (
             f"{generated_at.strftime('%B')} {generated_at.day}{_ordinal_suffix(generated_at.day)}, "
             f"{generated_at.year}, {generated_at.strftime('%H:%M:%S')} GMT"
         )
         generated_line = f"Collection generated on {human_timestamp}."
 
-        info_obj_raw: Any = collection.get('info', {})
-        info_obj: dict[str, Any] = cast(dict[str, Any], info_obj_raw) if isinstance(info_obj_raw, dict) else {}
         existing_desc = str(info_obj.get('description', '') or '').strip()
         info_obj['description'] = generated_line if not existing_desc else f"{generated_line}\n\n{existing_desc}"
         info_obj['x-api-id'] = self.api_id_slug
         info_obj['x-generated-at'] = self.generated_at_iso
-        collection['info'] = info_obj
         
-        # Generate filename with version and timestamp (reusing collection_name for consistency)
-        timestamp = generated_at.strftime('%Y%m%d_%H%M%S')
-        filename = f"{sanitize_filename(collection_name)}_{timestamp}_collection.json"
+        # Generate filename with version and timestamp
+        filename = f"{self.filename_base}_{self.file_timestamp}_collection.json"
         file_path = self.output_folder / filename
         
-        # Write collection file
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(collection, f, indent=2, ensure_ascii=False)
+        # Write collection file: {"info": ..., "item": [auth folder, endpoint folders...]}
+        with open(file_path, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+            f.write(_COLLECTION_PREFIX + _dumps_json(info_obj, 1) + _COLLECTION_ITEMS_START)
+            f.write(_dumps_json(auth_folder, 2))
+            for folder_name, requests in endpoint_folders.items():
+                f.write(_FOLDER_START + _dumps_json(folder_name) + _FOLDER_ITEMS_START)
+                f.write(b','.join(_FOLDER_ITEM_SEPARATOR + request for request in requests))
+                f.write(_FOLDER_END)
+            f.write(_COLLECTION_SUFFIX)
         
-        print(f"Generated collection: {file_path}")
+        if self.verbose:
+            print(f"Generated collection: {file_path}")
+        return str(file_path)
+
+    def _write_environment_file(
+        self,
+        env_name: str,
+        base_url: str,
+        timestamp: str,
+        name_base: str,
+        filename_base: str,
+        x_postman_envs: dict[str, Any],
+    ) -> str:
+        """
+        Build the Postman environment of one environment and write it to its own file.
+
+        Returns:
+            Path to the generated environment file
+        """
+        # Get environment-specific values from x-postman-environments
+        env_config_raw: Any = x_postman_envs.get(env_name, {})
+        env_config: dict[str, str] = cast(dict[str, str], env_config_raw) if isinstance(env_config_raw, dict) else {}
+        
+        # Merge global variables with environment-specific ones (env-specific overrides global)
+        merged_config: dict[str, str] = {**self.global_vars, **env_config}
+        
+        # Determine baseUrl based on environment
+        env_base_url = base_url
+        if env_name == 'staging':
+            # Use staging server from OpenAPI servers array
+            servers = self.openapi_spec.get('servers', [])
+            for server in servers:
+                if 'stg' in server.get('url', '').lower() or 'staging' in server.get('description', '').lower():
+                    env_base_url = server.get('url', base_url)
+                    break
+        elif env_name == 'production':
+            # Use production server (usually the first without staging markers)
+            servers = self.openapi_spec.get('servers', [])
+            for server in servers:
+                if 'stg' not in server.get('url', '').lower() and 'staging' not in server.get('description', '').lower():
+                    env_base_url = server.get('url', base_url)
+                    break
+
+        # Build baseUrl as <server-url>/<vN> where vN comes from info.version
+        env_base_url = self._append_version_to_server_url(str(env_base_url))
+        
+        environment: dict[str, Any] = {
+            'id': f"{env_name}-{timestamp}",
+            'name': f"{name_base} - {env_name.capitalize()}",
+            'x-api-id': self.api_id_slug,
+            'x-generated-at': self.generated_at_iso,
+            'values': [
+                {
+                    'key': 'baseUrl',
+                    'value': env_base_url,
+                    'type': 'default',
+                    'enabled': True
+                },
+                {
+                    'key': 'environment',
+                    'value': env_name,
+                    'type': 'default',
+                    'enabled': True
+                },
+                {
+                    'key': 'tenantId',
+                    'value': merged_config.get('tenantId', ''),
+                    'type': 'secret',
+                    'enabled': True
+                },
+                {
+                    'key': 'clientId',
+                    'value': merged_config.get('clientId', ''),
+                    'type': 'secret',
+                    'enabled': True
+                },
+                {
+                    'key': 'clientSecret',
+                    'value': merged_config.get('clientSecret', '<replace-with-your-secret>'),
+                    'type': 'secret',
+                    'enabled': True
+                },
+                {
+                    'key': 'scope',
+                    'value': merged_config.get('scope', 'api://.default'),
+                    'type': 'default',
+                    'enabled': True
+                },
+                {
+                    'key': 'accessToken',
+                    'value': '',
+                    'type': 'secret',
+                    'enabled': True
+                }
+            ],
+            '_postman_variable_scope': 'environment'
+        }
+
+        # Append any additional variables provided via x-postman-environments
+        existing_keys = {v.get('key') for v in environment['values'] if isinstance(v, dict)}
+        for key in sorted(merged_config.keys()):
+            if key in existing_keys:
+                continue
+            value = merged_config.get(key, '')
+            inferred_type = 'secret' if re.search(r'(secret|token|key|password)', key, flags=re.IGNORECASE) else 'default'
+            environment['values'].append(
+                {
+                    'key': key,
+                    'value': value,
+                    'type': inferred_type,
+                    'enabled': True
+                }
+            )
+        
+        # Generate filename using consistent naming (reusing filename_base for consistency)
+        filename = f"{filename_base}_{timestamp}_{env_name}_environment.json"
+        file_path = self.output_folder / filename
+        
+        # Write environment file
+        _write_json_file(file_path, environment)
+
         return str(file_path)
 
     def generate_environment_files(self) -> list[str]:
@@ -718,13 +1117,6 @@ class OpenAPIToPostmanConverter:
             raise Exception("OpenAPI specification not loaded. Call load_openapi_spec() first.")
         
         base_url = self._get_base_url()
-        generated_files: list[str] = []
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        
-        # Determine name prefix with version (avoiding double 'v' prefix)
-        version_prefix = '' if self.api_version.startswith('v') else 'v'
-        name_base = f"{self.api_title} {version_prefix}{self.api_version}"
-        filename_base = sanitize_filename(name_base)
         
         # Get x-postman-environments from OpenAPI spec (if exists)
         x_postman_envs_raw: Any = self.openapi_spec.get('x-postman-environments', {})
@@ -732,112 +1124,17 @@ class OpenAPIToPostmanConverter:
 
         assert self.environments is not None
         
-        for env_name in self.environments:
-            # Get environment-specific values from x-postman-environments
-            env_config_raw: Any = x_postman_envs.get(env_name, {})
-            env_config: dict[str, str] = cast(dict[str, str], env_config_raw) if isinstance(env_config_raw, dict) else {}
-            
-            # Merge global variables with environment-specific ones (env-specific overrides global)
-            merged_config: dict[str, str] = {**self.global_vars, **env_config}
-            
-            # Determine baseUrl based on environment
-            env_base_url = base_url
-            if env_name == 'staging':
-                # Use staging server from OpenAPI servers array
-                servers = self.openapi_spec.get('servers', [])
-                for server in servers:
-                    if 'stg' in server.get('url', '').lower() or 'staging' in server.get('description', '').lower():
-                        env_base_url = server.get('url', base_url)
-                        break
-            elif env_name == 'production':
-                # Use production server (usually the first without staging markers)
-                servers = self.openapi_spec.get('servers', [])
-                for server in servers:
-                    if 'stg' not in server.get('url', '').lower() and 'staging' not in server.get('description', '').lower():
-                        env_base_url = server.get('url', base_url)
-                        break
-
-            # Build baseUrl as <server-url>/<vN> where vN comes from info.version
-            env_base_url = self._append_version_to_server_url(str(env_base_url))
-            
-            environment: dict[str, Any] = {
-                'id': f"{env_name}-{timestamp}",
-                'name': f"{name_base} - {env_name.capitalize()}",
-                'x-api-id': self.api_id_slug,
-                'x-generated-at': self.generated_at_iso,
-                'values': [
-                    {
-                        'key': 'baseUrl',
-                        'value': env_base_url,
-                        'type': 'default',
-                        'enabled': True
-                    },
-                    {
-                        'key': 'environment',
-                        'value': env_name,
-                        'type': 'default',
-                        'enabled': True
-                    },
-                    {
-                        'key': 'tenantId',
-                        'value': merged_config.get('tenantId', ''),
-                        'type': 'secret',
-                        'enabled': True
-                    },
-                    {
-                        'key': 'clientId',
-                        'value': merged_config.get('clientId', ''),
-                        'type': 'secret',
-                        'enabled': True
-                    },
-                    {
-                        'key': 'clientSecret',
-                        'value': merged_config.get('clientSecret', '<replace-with-your-secret>'),
-                        'type': 'secret',
-                        'enabled': True
-                    },
-                    {
-                        'key': 'scope',
-                        'value': merged_config.get('scope', 'api://.default'),
-                        'type': 'default',
-                        'enabled': True
-                    },
-                    {
-                        'key': 'accessToken',
-                        'value': '',
-                        'type': 'secret',
-                        'enabled': True
-                    }
-                ],
-                '_postman_variable_scope': 'environment'
-            }
+        # Every environment goes to its own file: build and write them concurrently
+        with ThreadPoolExecutor(max_workers=max(1, min(MAX_WORKERS, len(self.environments)))) as executor:
+            generated_files = list(executor.map(
+                lambda env_name: self._write_environment_file(
+                    env_name, base_url, self.file_timestamp, self.name_base, self.filename_base, x_postman_envs
+                ),
+                self.environments,
+            ))
 
-            # Append any additional variables provided via x-postman-environments
-            existing_keys = {v.get('key') for v in environment['values'] if isinstance(v, dict)}
-            for key in sorted(merged_config.keys()):
-                if key in existing_keys:
-                    continue
-                value = merged_config.get(key, '')
-                inferred_type = 'secret' if re.search(r'(secret|token|key|password)', key, flags=re.IGNORECASE) else 'default'
-                environment['values'].append(
-                    {
-                        'key': key,
-                        'value': value,
-                        'type': inferred_type,
-                        'enabled': True
-                    }
-                )
-            
-            # Generate filename using consistent naming (reusing filename_base for consistency)
-            filename = f"{filename_base}_{timestamp}_{env_name}_environment.json"
-            file_path = self.output_folder / filename
-            
-            # Write environment file
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(environment, f, indent=2, ensure_ascii=False)
-            
-            generated_files.append(str(file_path))
-            print(f"Generated environment: {file_path}")
+        if self.verbose:
+            sys.stdout.write("".join(f"Generated environment: {file_path}\n" for file_path in generated_files))
         
         return generated_files
 
@@ -848,9 +1145,8 @@ class OpenAPIToPostmanConverter:
         Returns:
             Dictionary with paths to generated files
         """
-        print("=" * 60)
-        print("OpenAPI to Postman Converter")
-        print("=" * 60)
+        if self.verbose:
+            sys.stdout.write(f"{'=' * 60}\nOpenAPI to Postman Converter\n{'=' * 60}\n")
         
         # Load OpenAPI specification
         self.load_openapi_spec()
@@ -868,16 +1164,24 @@ class OpenAPIToPostmanConverter:
             'api_title': self.api_title
         }
         
-        print("=" * 60)
-        print("Conversion completed successfully!")
-        print(f"Collection: {collection_file}")
-        print(f"Environments: {len(environment_files)} files generated")
-        print("=" * 60)
+        if self.verbose:
+            sys.stdout.write(
+                f"{'=' * 60}\n"
+                "Conversion completed successfully!\n"
+                f"Collection: {collection_file}\n"
+                f"Environments: {len(environment_files)} files generated\n"
+                f"{'=' * 60}\n"
+            )
         
         return result
 
 
-def main(openapi_source: str, output_folder: str, environments: Optional[list[str]] = None):
+def main(
+    openapi_source: str,
+    output_folder: str,
+    environments: Optional[list[str]] = None,
+    verbose: bool = True,
+):
     """
     Main function for command-line usage.
     
@@ -885,6 +1189,7 @@ def main(openapi_source: str, output_folder: str, environments: Optional[list[st
         openapi_source: Path to OpenAPI file or URL
         output_folder: Directory where generated files will be saved
         environments: Optional list of environment names. If not provided, reads from x-postman-environments
+        verbose: If False, only the final summary (or error) is printed
     
     Returns:
         Exit code (0 for success, 1 for error)
@@ -893,22 +1198,25 @@ def main(openapi_source: str, output_folder: str, environments: Optional[list[st
         converter = OpenAPIToPostmanConverter(
             openapi_source=openapi_source,
             output_folder=output_folder,
-            environments=environments
+            environments=environments,
+            verbose=verbose,
         )
         
         result = converter.convert()
         
-        print()
-        print("=" * 70)
-        print("✅ GENERATION SUCCESSFUL")
-        print("=" * 70)
-        version_prefix = '' if str(result['api_version']).startswith('v') else 'v'
-        print(f"API: {result['api_title']} {version_prefix}{result['api_version']}")
-        print(f"Collection: {result['collection']}")
-        print(f"Environments ({len(result['environments'])} files):")
-        for env_file in result['environments']:
-            print(f"  - {env_file}")
-        print("=" * 70)
+        # Single summary, written at once
+        lines = [
+            "",
+            "=" * 70,
+            "✅ GENERATION SUCCESSFUL",
+            "=" * 70,
+            f"API: {converter.name_base}",
+            f"Collection: {result['collection']}",
+            f"Environments ({len(result['environments'])} files):",
+        ]
+        lines.extend(f"  - {env_file}" for env_file in result['environments'])
+        lines.append("=" * 70)
+        sys.stdout.write("\n".join(lines) + "\n")
         
         return 0
         
@@ -961,7 +1269,12 @@ OpenAPI x-postman-environments structure:
         default=None,
         help="Optional environment names (e.g., staging production). If not provided, reads from x-postman-environments in OpenAPI spec"
     )
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Only print the final summary, without progress messages"
+    )
     
     args = parser.parse_args()
     
-    exit(main(args.openapi_source, args.output_folder, args.environments))
+    exit(main(args.openapi_source, args.output_folder, args.environments, verbose=not args.quiet))
@@ -4,6 +4,9 @@ import re
 from typing import Any, Optional
 from urllib.parse import urlparse
 
+# Path template variables like "{userId}", compiled once as every operation's path goes through it
+_PATH_PARAM_RE = re.compile(r'\{([^}]+)\}')
+
 
 def sanitize_filename(filename: str) -> str:
     """
@@ -54,7 +57,7 @@ def extract_path_variables(path: str) -> list[str]:
     Returns:
         List of variable names
     """
-    return re.findall(r'\{([^}]+)\}', path)
+    return _PATH_PARAM_RE.findall(path)
 
 
 def convert_path_to_postman(path: str) -> str:
@@ -67,7 +70,7 @@ def convert_path_to_postman(path: str) -> str:
     Returns:
         Postman-formatted path (e.g., "/users/:userId")
     """
-    return re.sub(r'\{([^}]+)\}', r':\1', path)
+    return _PATH_PARAM_RE.sub(r':\1', path)
 
 
 def get_response_example(responses: dict[str, Any]) -> Optional[dict[str, Any]]:
@@ -33,6 +33,34 @@ def test_log_list_given_list_of_log_str_and_loglevel_then_calls_logging_for_each
     calls = [call(loglevel.value[0], log_list[0]), call(loglevel.value[0], log_list[1])]
     logging_mock.assert_has_calls(calls, any_order=True)
 
+
+@patch.object(logging, "log")
+def test_log_list_given_single_record_then_calls_logging_once_with_all_lines(logging_mock):
+    """ Given a list of strings to log and a loglevel, when single_record is True, then
+    calls logging once with all the strings, one per line"""
+    # Arrange
+    log_list = ["log1", "log2"]
+    loglevel = sut.LogLevel.warning
+    # Act
+    sut.log_list(iter(log_list), loglevel, single_record=True)
+    # Assert
+    logging_mock.assert_called_once_with(loglevel.value[0], "log1\nlog2")
+
+
+@patch.object(logging, "log")
+def test_log_list_given_single_record_when_level_disabled_then_lines_not_built(logging_mock):
+    """ Given a generator of strings to log, when single_record is True and the level is
+    disabled, then the generator isn't consumed and nothing is logged"""
+    # Arrange
+    consumed = []
+    log_lines = (consumed.append(log) or log for log in ["log1"])
+    # Act
+    with patch.object(logging.getLogger(), "isEnabledFor", return_value=False):
+        sut.log_list(log_lines, sut.LogLevel.debug, single_record=True)
+    # Assert
+    assert consumed == []
+    logging_mock.assert_not_called()
+
 # endregion
 
 # region log_stdouterr(output, level)
@@ -168,6 +168,24 @@ def test_get_filepaths_in_tree_given_starting_path_glob_when_paths_then_returns_
     # Assert
     assert result == filenames.paths
 
+
+def test_get_filepaths_in_tree_given_excluded_dirs_then_does_not_descend_into_them(tmp_path):
+    """Given a starting path, a glob and a list of excluded directories, it
+    returns the matching paths that are not inside an excluded directory."""
+
+    # Arrange
+    for directory in ["api/v1", "node_modules/lib", ".git"]:
+        (tmp_path / directory).mkdir(parents=True)
+    for file in ["root.openapi.yaml", "api/v1/v1.openapi.yml", "api/v1/readme.md",
+                 "node_modules/lib/lib.openapi.yaml", ".git/git.openapi.yaml"]:
+        (tmp_path / file).write_text("")
+
+    # Act
+    result = sut.get_file_paths_in_tree(str(tmp_path), "*.openapi.y*ml", {".git", "node_modules"})
+
+    # Assert
+    assert sorted(result) == sorted([tmp_path / "root.openapi.yaml", tmp_path / "api/v1/v1.openapi.yml"])
+
 # endregion
 
 # region get_filepath_in_tree() ASCENDING
@@ -1,5 +1,6 @@
 """ Unit tests for the project_types/azure/api_management.py module"""
 
+import logging
 from unittest.mock import patch
 from devops_toolset.project_types.azure import api_management
 
@@ -70,6 +71,22 @@ def test_get_apim_apis_when_result_is_string(logging_mock, cli_mock):
     assert result == [{"displayName": "test_api"}]
 
 
+@patch('devops_toolset.project_types.azure.api_management.cli')
+@patch('devops_toolset.core.log_tools.logging')
+@patch('devops_toolset.project_types.azure.api_management.logging')
+def test_get_apim_apis_logs_all_apis_in_a_single_record(logging_mock, log_tools_logging_mock, cli_mock):
+    """Should log every API in one record, falling back to the name when there is no display name."""
+
+    # Arrange
+    cli_mock.call_subprocess_with_result.return_value = '[{"displayName": "test_api"}, {"name": "other_api"}]'
+
+    # Act
+    api_management.get_apim_apis('resource_group_name', 'apim_name')
+
+    # Assert
+    log_tools_logging_mock.log.assert_called_once_with(logging.INFO, "\ttest_api\n\tother_api")
+
+
 @patch('devops_toolset.project_types.azure.api_management.cli')
 @patch('devops_toolset.project_types.azure.api_management.logging')
 def test_get_apim_apis_when_result_is_tuple(logging_mock, cli_mock):
@@ -115,3 +132,86 @@ def test_get_apim_apis_when_result_is_boolean(logging_mock, cli_mock):
     assert result is None
 
 # endregion
+
+# region is_openapi_contract_deployable()
+
+
+def test_is_openapi_contract_deployable_when_x_deploy_is_true(tmp_path):
+    """Should return True when the contract has x-deploy set to true."""
+
+    # Arrange
+    contract_path = tmp_path / "test.openapi.yaml"
+    contract_path.write_text("openapi: 3.0.0\nx-deploy: true\n")
+
+    # Act
+    result = api_management.is_openapi_contract_deployable(str(contract_path))
+
+    # Assert
+    assert result is True
+
+
+def test_is_openapi_contract_deployable_when_x_deploy_is_false(tmp_path):
+    """Should return False when the contract has x-deploy set to false."""
+
+    # Arrange
+    contract_path = tmp_path / "test.openapi.yaml"
+    contract_path.write_text("openapi: 3.0.0\nx-deploy: false\n")
+
+    # Act
+    result = api_management.is_openapi_contract_deployable(str(contract_path))
+
+    # Assert
+    assert result is False
+
+
+@patch('devops_toolset.project_types.azure.api_management.yaml')
+def test_is_openapi_contract_deployable_when_x_deploy_is_missing(yaml_mock, tmp_path):
+    """Should return False without parsing the contract when it doesn't mention x-deploy."""
+
+    # Arrange
+    contract_path = tmp_path / "test.openapi.yaml"
+    contract_path.write_text("openapi: 3.0.0\n")
+
+    # Act
+    result = api_management.is_openapi_contract_deployable(str(contract_path))
+
+    # Assert
+    assert result is False
+    yaml_mock.load.assert_not_called()
+
+# endregion
+
+# region get_openapi_contracts()
+
+
+@patch('devops_toolset.project_types.azure.api_management.get_file_paths_in_tree')
+@patch('devops_toolset.project_types.azure.api_management.logging')
+def test_get_openapi_contracts_returns_deployable_contracts_in_order(logging_mock, get_file_paths_mock, tmp_path):
+    """Should return only the deployable contracts, keeping the order in which they were found."""
+
+    # Arrange
+    contract_paths = []
+    for name, content in [("c", "x-deploy: true"), ("b", "x-deploy: false"), ("d", ""), ("a", "x-deploy: true")]:
+        contract_path = tmp_path / f"{name}.openapi.yaml"
+        contract_path.write_text(f"openapi: 3.0.0\n{content}\n")
+        contract_paths.append(contract_path)
+    get_file_paths_mock.return_value = contract_paths
+
+    # Act
+    result = api_management.get_openapi_contracts(str(tmp_path))
+
+    # Assert
+    assert result == [contract_paths[0], contract_paths[3]]
+
+
+@patch('devops_toolset.project_types.azure.api_management.logging')
+def test_get_openapi_contracts_when_no_contracts(logging_mock, tmp_path):
+    """Should return an empty list when there are no contracts."""
+
+    # Act
+    result = api_management.get_openapi_contracts(str(tmp_path))
+
+    # Assert
+    assert result == []
+
+# endregion
@@ -4,10 +4,12 @@ Tests the OpenAPI to Postman converter functionality.
 """
 
 import json
+import re
 import pytest
+import yaml
 from pathlib import Path
 from unittest.mock import Mock, patch, mock_open
-from devops_toolset.project_types.postman.openapi_to_postman import OpenAPIToPostmanConverter
+from devops_toolset.project_types.postman.openapi_to_postman import OpenAPIToPostmanConverter, _dumps_json
 from devops_toolset.project_types.postman.deploy_to_workspace import (
     _collection_name_from_export,
     _collection_api_id_from_export,
@@ -15,6 +17,8 @@ from devops_toolset.project_types.postman.deploy_to_workspace import (
     _environment_api_id_from_export,
     _wrap_collection_for_api,
     _wrap_environment_for_api,
+    _strip_version_from_name,
+    PostmanWorkspaceAssets,
     get_workspace_assets,
     upsert_collection,
     upsert_environment,
@@ -170,6 +174,108 @@ class TestOpenAPIToPostmanConverter:
         assert converter.api_title == "Test API"
         assert converter.api_version == "1.0.0"
 
+    def test_load_openapi_spec_reuses_parsed_yaml(self, temp_output_dir, sample_openapi_spec):
+        """Test an unchanged YAML spec is parsed only once."""
+        spec_file = temp_output_dir / "test_spec.yaml"
+        spec_file.write_text(yaml.safe_dump(sample_openapi_spec), encoding='utf-8')
+        cache_dir = temp_output_dir / "cache"
+
+        with patch("devops_toolset.project_types.postman.openapi_to_postman.SPEC_CACHE_DIR", cache_dir):
+            first = OpenAPIToPostmanConverter(str(spec_file), str(temp_output_dir), environments=["test"])
+            first.load_openapi_spec()
+            with patch("yaml.load") as yaml_load_mock:
+                second = OpenAPIToPostmanConverter(str(spec_file), str(temp_output_dir), environments=["test"])
+                second.load_openapi_spec()
+
+        yaml_load_mock.assert_not_called()
+        assert first.openapi_spec == second.openapi_spec == sample_openapi_spec
+        assert len(list(cache_dir.iterdir())) == 1
+
+    def test_load_openapi_spec_cached_yaml_keeps_types(self, temp_output_dir):
+        """Test a cached YAML spec comes back with its dates, non-string keys and aliases."""
+        spec_file = temp_output_dir / "test_spec.yaml"
+        spec_file.write_text(
+            "openapi: 3.0.0\n"
+            "info: {title: Test API, version: 1.0.0}\n"
+            "x-released: 2024-01-31\n"
+            "x-built: 2024-01-31 10:00:00+00:00\n"
+            "x-shared: &shared {limit: 10}\n"
+            "x-copy: *shared\n"
+            "paths: {/users: {get: {responses: {200: {description: OK}}}}}\n",
+            encoding='utf-8'
+        )
+        cache_dir = temp_output_dir / "cache"
+
+        with patch("devops_toolset.project_types.postman.openapi_to_postman.SPEC_CACHE_DIR", cache_dir):
+            first = OpenAPIToPostmanConverter(str(spec_file), str(temp_output_dir), environments=["test"])
+            first.load_openapi_spec()
+            with patch("yaml.load") as yaml_load_mock:
+                second = OpenAPIToPostmanConverter(str(spec_file), str(temp_output_dir), environments=["test"])
+                second.load_openapi_spec()
+
+        yaml_load_mock.assert_not_called()
+        assert second.openapi_spec == first.openapi_spec
+        assert 200 in second.openapi_spec['paths']['/users']['get']['responses']
+        assert second.openapi_spec['x-copy'] is second.openapi_spec['x-shared']
+        assert [p.suffix for p in cache_dir.iterdir()] == ['.marshal']
+
+    def test_load_openapi_spec_prunes_yaml_cache(self, temp_output_dir, sample_openapi_spec):
+        """Test the parsed YAML cache keeps only the most recently used entries."""
+        cache_dir = temp_output_dir / "cache"
+        cache_dir.mkdir()
+        (cache_dir / "legacy.pickle").write_bytes(b"")
+        module = "devops_toolset.project_types.postman.openapi_to_postman"
+
+        with patch(f"{module}.SPEC_CACHE_DIR", cache_dir), patch(f"{module}.SPEC_CACHE_MAX_ENTRIES", 2):
+            for version in ("1.0.0", "2.0.0", "3.0.0"):
+                spec_file = temp_output_dir / f"spec_{version}.yaml"
+                spec_file.write_text(
+                    yaml.safe_dump({**sample_openapi_spec, "info": {"title": "Test API", "version": version}}),
+                    encoding='utf-8'
+                )
+                OpenAPIToPostmanConverter(str(spec_file), str(temp_output_dir), environments=["test"]).load_openapi_spec()
+
+        assert len(list(cache_dir.glob("*.marshal"))) == 2
+        assert not list(cache_dir.glob("*.pickle"))
+
+    def test_load_openapi_spec_detects_format_without_failed_parse(self, temp_output_dir, sample_openapi_spec):
+        """Test a spec without a known extension is parsed by the right parser only."""
+        yaml_file = temp_output_dir / "yaml_spec.txt"
+        yaml_file.write_text(yaml.safe_dump(sample_openapi_spec), encoding='utf-8')
+        json_file = temp_output_dir / "json_spec.txt"
+        json_file.write_text(json.dumps(sample_openapi_spec, indent=2), encoding='utf-8')
+
+        module = "devops_toolset.project_types.postman.openapi_to_postman"
+        with patch(f"{module}.SPEC_CACHE_DIR", temp_output_dir / "cache"), \
+                patch(f"{module}._loads_json", wraps=json.loads) as loads_json_mock:
+            yaml_converter = OpenAPIToPostmanConverter(str(yaml_file), str(temp_output_dir), environments=["test"])
+            yaml_converter.load_openapi_spec()
+            loads_json_mock.assert_not_called()
+
+            json_converter = OpenAPIToPostmanConverter(str(json_file), str(temp_output_dir), environments=["test"])
+            json_converter.load_openapi_spec()
+            loads_json_mock.assert_called_once()
+
+        assert yaml_converter.openapi_spec == json_converter.openapi_spec == sample_openapi_spec
+
+    def test_load_openapi_spec_revalidates_downloaded_spec(self, temp_output_dir, sample_openapi_spec):
+        """Test a spec downloaded before is reused when the server answers 304 Not Modified."""
+        body = json.dumps(sample_openapi_spec).encode()
+        first_response = Mock(status_code=200, content=body, headers={'ETag': '"v1"'})
+        not_modified = Mock(status_code=304, headers={})
+        url = "https://example.com/openapi.json"
+
+        with patch("devops_toolset.project_types.postman.openapi_to_postman.SPEC_CACHE_DIR", temp_output_dir / "cache"), \
+                patch("devops_toolset.project_types.postman.openapi_to_postman.requests.get",
+                      side_effect=[first_response, not_modified]) as get_mock:
+            for _ in range(2):
+                converter = OpenAPIToPostmanConverter(url, str(temp_output_dir), environments=["test"])
+                converter.load_openapi_spec()
+                assert converter.openapi_spec == sample_openapi_spec
+
+        assert "If-None-Match" not in get_mock.call_args_list[0].kwargs["headers"]
+        assert get_mock.call_args_list[1].kwargs["headers"]["If-None-Match"] == '"v1"'
+
     def test_get_base_url(self, temp_output_dir, sample_openapi_spec):
         """Test extracting base URL from OpenAPI spec."""
         spec_file = temp_output_dir / "test_spec.json"
@@ -253,6 +359,57 @@ class TestOpenAPIToPostmanConverter:
         assert 'raw' in result
         assert 'Test' in result['raw']
 
+    def test_convert_request_body_reuses_shared_example(self, temp_output_dir):
+        """Test that an example shared by several request bodies is encoded only once."""
+        converter = OpenAPIToPostmanConverter(
+            openapi_source="test.json",
+            output_folder=str(temp_output_dir),
+            environments=["test"]
+        )
+
+        shared_example = {"name": "Test", "value": 123}
+        request_bodies = [
+            {"content": {"application/json": {"example": shared_example}}},
+            {"content": {"application/json": {"example": shared_example}}},
+        ]
+
+        with patch(
+            "devops_toolset.project_types.postman.openapi_to_postman._dumps_json", wraps=_dumps_json
+        ) as dumps_mock:
+            results = [converter._convert_request_body(body) for body in request_bodies]
+
+        assert dumps_mock.call_count == 1
+        assert results[0] == results[1]
+        assert results[0]['raw'] == json.dumps(shared_example, indent=2, ensure_ascii=False)
+
+    def test_convert_request_body_resolves_refs(self, temp_output_dir):
+        """Test that referenced request bodies and examples are resolved."""
+        converter = OpenAPIToPostmanConverter(
+            openapi_source="test.json",
+            output_folder=str(temp_output_dir),
+            environments=["test"]
+        )
+        converter.openapi_spec = {
+            "components": {
+                "requestBodies": {
+                    "Pet": {
+                        "content": {
+                            "application/json": {
+                                "examples": {"cat": {"$ref": "#/components/examples/Cat"}}
+                            }
+                        }
+                    }
+                },
+                "examples": {"Cat": {"value": {"name": "Tom"}}},
+            }
+        }
+
+        result = converter._convert_request_body({"$ref": "#/components/requestBodies/Pet"})
+
+        assert result is not None
+        assert json.loads(result['raw']) == {"name": "Tom"}
+        assert converter._convert_request_body({"$ref": "#/components/requestBodies/Missing"}) is None
+
     def test_create_auth_request(self, temp_output_dir):
         """Test creation of JWT auth request."""
         converter = OpenAPIToPostmanConverter(
@@ -316,6 +473,9 @@ class TestOpenAPIToPostmanConverter:
         query_keys = [q.get('key') for q in list_users['request']['url'].get('query', [])]
         assert 'limit' in query_keys
 
+        # Same layout as json.dump(..., indent=2, ensure_ascii=False)
+        assert Path(collection_path).read_text(encoding='utf-8') == json.dumps(collection, indent=2, ensure_ascii=False)
+
     def test_generate_environment_files(self, temp_output_dir, sample_openapi_spec):
         """Test environment file generation."""
         spec_file = temp_output_dir / "test_spec.json"
@@ -351,6 +511,44 @@ class TestOpenAPIToPostmanConverter:
             assert 'clientId' in var_keys
             assert 'clientSecret' in var_keys
 
+    def test_generated_files_share_timestamp(self, temp_output_dir, sample_openapi_spec):
+        """Test that the collection and environment files of one run share the same timestamp."""
+        spec_file = temp_output_dir / "test_spec.json"
+        with open(spec_file, 'w') as f:
+            json.dump(sample_openapi_spec, f)
+
+        converter = OpenAPIToPostmanConverter(
+            openapi_source=str(spec_file),
+            output_folder=str(temp_output_dir),
+            environments=["staging", "production"]
+        )
+
+        converter.load_openapi_spec()
+        collection_path = converter.generate_collection()
+        env_files = converter.generate_environment_files()
+
+        prefix = f"{converter.filename_base}_{converter.file_timestamp}_"
+        for file_path in [collection_path, *env_files]:
+            assert Path(file_path).name.startswith(prefix)
+
+    def test_convert_quiet(self, temp_output_dir, sample_openapi_spec, capsys):
+        """Test that a non-verbose conversion prints nothing."""
+        spec_file = temp_output_dir / "test_spec.json"
+        with open(spec_file, 'w') as f:
+            json.dump(sample_openapi_spec, f)
+
+        converter = OpenAPIToPostmanConverter(
+            openapi_source=str(spec_file),
+            output_folder=str(temp_output_dir),
+            environments=["staging", "production"],
+            verbose=False
+        )
+
+        result = converter.convert()
+
+        assert len(result['environments']) == 2
+        assert capsys.readouterr().out == ""
+
     def test_generate_environment_files_includes_extra_x_postman_variables(self, temp_output_dir, sample_openapi_spec):
         """Extra variables in x-postman-environments should be included in environment output."""
         spec = dict(sample_openapi_spec)
@@ -592,17 +790,28 @@ class TestPostmanDeployToWorkspace:
         assert "environment" in wrapped
         assert wrapped["environment"]["name"] == "My Env"
 
-    @patch("devops_toolset.project_types.postman.deploy_to_workspace.requests.request")
+    @pytest.mark.parametrize("name", [
+        "Test API v1-rev0 v1.0.0",
+        "Test API v2-rev1 v2.5.0 - Development",
+        "Payments Gateway - Staging",
+        "  Orders\tAPI  ",
+        "Invoices V3.1",
+    ])
+    def test_strip_version_from_name_matches_regex(self, name):
+        pattern = re.compile(r'\s+v\d+([-.]\w+)*(\s+v?\d+(\.\d+)*)?', re.IGNORECASE)
+        assert _strip_version_from_name(name) == pattern.sub('', name).strip()
+
+    @patch("devops_toolset.project_types.postman.deploy_to_workspace._SESSION.request")
     def test_get_workspace_assets_maps_by_name(self, request_mock: Mock):
         resp = Mock()
         resp.ok = True
         resp.status_code = 200
-        resp.json.return_value = {
+        resp.content = json.dumps({
             "workspace": {
                 "collections": [{"name": "C1", "uid": "c-uid"}],
                 "environments": [{"name": "E1", "uid": "e-uid"}],
             }
-        }
+        }).encode()
         request_mock.return_value = resp
 
         assets = get_workspace_assets("https://api.postman.com", "k", "w")
@@ -612,17 +821,85 @@ class TestPostmanDeployToWorkspace:
         assert len(assets.collections_by_api_id) == 0
         assert len(assets.environments_by_api_id) == 0
 
-    @patch("devops_toolset.project_types.postman.deploy_to_workspace.requests.request")
+    @patch("devops_toolset.project_types.postman.deploy_to_workspace._SESSION.request")
+    def test_get_workspace_assets_maps_by_api_id(self, request_mock: Mock):
+        responses = {
+            "/workspaces/w": {
+                "workspace": {
+                    "collections": [{"name": "C1", "uid": "c1"}, {"name": "C2", "uid": "c2"}],
+                    "environments": [{"name": "E1", "uid": "e1"}],
+                }
+            },
+            "/collections/c1": {"collection": {"info": {"name": "C1", "x-api-id": "api-1"}}},
+            "/collections/c2": {"collection": {"info": {"name": "C2"}}},
+            "/environments/e1": {"environment": {"name": "E1", "x-api-id": "api-1"}},
+        }
+
+        def respond(**kwargs):
+            path = kwargs["url"].replace("https://api.postman.com", "")
+            return Mock(ok=True, status_code=200, content=json.dumps(responses[path]).encode())
+
+        request_mock.side_effect = respond
+
+        assets = get_workspace_assets("https://api.postman.com", "k", "w", concurrency=2)
+        assert assets.collections_by_name == {"C1": "c1", "C2": "c2"}
+        assert assets.collections_by_api_id == {"api-1": "c1"}
+        assert assets.environments_by_api_id == {"api-1": "e1"}
+        assert assets.collections_by_base_name == {"C1": "c1", "C2": "c2"}
+        assert request_mock.call_count == 4
+
+    @patch("devops_toolset.project_types.postman.deploy_to_workspace._SESSION.request")
+    def test_get_workspace_assets_reuses_cached_api_ids(self, request_mock: Mock, tmp_path):
+        responses = {
+            "/workspaces/w": {"workspace": {"collections": [{"name": "C1", "uid": "c1"}], "environments": []}},
+            "/collections/c1": {"collection": {"info": {"name": "C1", "x-api-id": "api-1"}}},
+        }
+
+        def respond(**kwargs):
+            path = kwargs["url"].replace("https://api.postman.com", "")
+            return Mock(ok=True, status_code=200, content=json.dumps(responses[path]).encode())
+
+        request_mock.side_effect = respond
+
+        with patch("devops_toolset.project_types.postman.deploy_to_workspace.API_IDS_CACHE_PATH",
+                   str(tmp_path / "api-ids.json")):
+            first = get_workspace_assets("https://api.postman.com", "k", "w", cache_ttl=60)
+            second = get_workspace_assets("https://api.postman.com", "k", "w", cache_ttl=60)
+
+        assert first.collections_by_api_id == second.collections_by_api_id == {"api-1": "c1"}
+        # The second call only lists the workspace
+        assert [c.kwargs["url"].rsplit("/", 2)[-2:] for c in request_mock.call_args_list] == [
+            ["workspaces", "w"], ["collections", "c1"], ["workspaces", "w"]
+        ]
+
+    @patch("devops_toolset.project_types.postman.deploy_to_workspace._SESSION.request")
+    def test_get_workspace_assets_without_api_ids(self, request_mock: Mock):
+        resp = Mock(ok=True, status_code=200)
+        resp.content = json.dumps({
+            "workspace": {
+                "collections": [{"name": "C1", "uid": "c1"}],
+                "environments": [{"name": "E1", "uid": "e1"}],
+            }
+        }).encode()
+        request_mock.return_value = resp
+
+        assets = get_workspace_assets("https://api.postman.com", "k", "w", include_api_ids=False)
+        assert assets.collections_by_name == {"C1": "c1"}
+        assert assets.environments_by_name == {"E1": "e1"}
+        assert assets.collections_by_api_id == {}
+        assert request_mock.call_count == 1
+
+    @patch("devops_toolset.project_types.postman.deploy_to_workspace._SESSION.request")
     def test_upsert_collection_updates_when_exists(self, request_mock: Mock):
         # GET workspace, GET individual collection to read x-api-id, then PUT collection
         resp_get_workspace = Mock(ok=True, status_code=200)
-        resp_get_workspace.json.return_value = {"workspace": {"collections": [{"name": "C1", "uid": "c-uid"}], "environments": []}}
+        resp_get_workspace.content = json.dumps({"workspace": {"collections": [{"name": "C1", "uid": "c-uid"}], "environments": []}}).encode()
 
         resp_get_collection = Mock(ok=True, status_code=200)
-        resp_get_collection.json.return_value = {"collection": {"info": {"name": "C1"}}}
+        resp_get_collection.content = json.dumps({"collection": {"info": {"name": "C1"}}}).encode()
 
         resp_put = Mock(ok=True, status_code=200)
-        resp_put.json.return_value = {"collection": {"uid": "c-uid"}}
+        resp_put.content = json.dumps({"collection": {"uid": "c-uid"}}).encode()
 
         request_mock.side_effect = [resp_get_workspace, resp_get_collection, resp_put]
 
@@ -640,14 +917,14 @@ class TestPostmanDeployToWorkspace:
         assert last_call["method"] == "PUT"
         assert last_call["url"].endswith("/collections/c-uid")
 
-    @patch("devops_toolset.project_types.postman.deploy_to_workspace.requests.request")
+    @patch("devops_toolset.project_types.postman.deploy_to_workspace._SESSION.request")
     def test_upsert_environment_creates_when_missing(self, request_mock: Mock):
         # GET workspace then POST environment
         resp_get = Mock(ok=True, status_code=200)
-        resp_get.json.return_value = {"workspace": {"environments": []}}
+        resp_get.content = json.dumps({"workspace": {"environments": []}}).encode()
 
         resp_post = Mock(ok=True, status_code=200)
-        resp_post.json.return_value = {"environment": {"uid": "e-new"}}
+        resp_post.content = json.dumps({"environment": {"uid": "e-new"}}).encode()
 
         request_mock.side_effect = [resp_get, resp_post]
 
@@ -665,7 +942,76 @@ class TestPostmanDeployToWorkspace:
         assert last_call["method"] == "POST"
         assert last_call["url"].endswith("/environments")
         assert last_call["params"]["workspace"] == "w"
+        assert json.loads(last_call["data"]) == {"environment": {"name": "Env1", "values": []}}
+
+    @patch("devops_toolset.project_types.postman.deploy_to_workspace._SESSION.request")
+    def test_upsert_environment_reuses_given_assets(self, request_mock: Mock):
+        # Only the POST goes out, and the created environment is found by the next upsert
+        resp_post = Mock(ok=True, status_code=200)
+        resp_post.content = json.dumps({"environment": {"uid": "e-new"}}).encode()
+        resp_put = Mock(ok=True, status_code=200)
+        resp_put.content = json.dumps({"environment": {"uid": "e-new"}}).encode()
+        request_mock.side_effect = [resp_post, resp_put]
+        assets = PostmanWorkspaceAssets({}, {}, {}, {})
+
+        first = upsert_environment("https://api.postman.com", "k", "w", {"name": "Env1", "values": []}, assets=assets)
+        second = upsert_environment("https://api.postman.com", "k", "w", {"name": "Env1", "values": []}, assets=assets)
+
+        assert first == ("created", "Env1", "e-new")
+        assert second == ("updated", "Env1", "e-new")
+        assert [c.kwargs["method"] for c in request_mock.call_args_list] == ["POST", "PUT"]
+
+    @patch("devops_toolset.project_types.postman.deploy_to_workspace._SESSION.request")
+    def test_upsert_collection_updates_other_version_by_base_name(self, request_mock: Mock):
+        resp_put = Mock(ok=True, status_code=200)
+        resp_put.content = json.dumps({"collection": {"uid": "c-old"}}).encode()
+        request_mock.return_value = resp_put
+        assets = PostmanWorkspaceAssets(
+            collections_by_name={"Test API v1-rev0 v1.0.0": "c-old"},
+            collections_by_api_id={},
+            environments_by_name={},
+            environments_by_api_id={},
+            collections_by_base_name={"Test API": "c-old"},
+        )
+
+        action, uid = upsert_collection(
+            "https://api.postman.com", "k", "w", {"info": {"name": "Test API v2-rev0 v2.0.0"}, "item": []}, assets=assets
+        )
 
+        assert (action, uid) == ("updated", "c-old")
+        assert request_mock.call_args.kwargs["url"].endswith("/collections/c-old")
+
+    @patch("devops_toolset.project_types.postman.deploy_to_workspace._SESSION.request")
+    def test_upsert_collection_skips_unchanged_payload(self, request_mock: Mock, tmp_path):
+        request_mock.return_value = Mock(ok=True, status_code=200, content=b'{"collection": {"uid": "c1"}}')
+        assets = PostmanWorkspaceAssets({"C1": "c1"}, {}, {}, {})
+        export = {"info": {"name": "C1"}, "item": []}
+
+        with patch("devops_toolset.project_types.postman.deploy_to_workspace.PAYLOAD_HASHES_CACHE_PATH",
+                   str(tmp_path / "hashes.json")):
+            first = upsert_collection("https://api.postman.com", "k", "w", export, assets=assets, skip_unchanged_ttl=60)
+            second = upsert_collection("https://api.postman.com", "k", "w", export, assets=assets, skip_unchanged_ttl=60)
+            changed = upsert_collection(
+                "https://api.postman.com", "k", "w", {**export, "item": [{"name": "r"}]}, assets=assets,
+                skip_unchanged_ttl=60
+            )
+
+        assert (first, second, changed) == (("updated", "c1"), ("unchanged", "c1"), ("updated", "c1"))
+        assert request_mock.call_count == 2
+
+    @patch("devops_toolset.project_types.postman.deploy_to_workspace._SESSION.request")
+    def test_upsert_collection_uploads_unchanged_payload_by_default(self, request_mock: Mock, tmp_path):
+        request_mock.return_value = Mock(ok=True, status_code=200, content=b'{"collection": {"uid": "c1"}}')
+        assets = PostmanWorkspaceAssets({"C1": "c1"}, {}, {}, {})
+        export = {"info": {"name": "C1"}, "item": []}
+
+        with patch("devops_toolset.project_types.postman.deploy_to_workspace.PAYLOAD_HASHES_CACHE_PATH",
+                   str(tmp_path / "hashes.json")):
+            results = [upsert_collection("https://api.postman.com", "k", "w", export, assets=assets) for _ in range(2)]
+
+        assert results == [("updated", "c1"), ("updated", "c1")]
+        assert request_mock.call_count == 2
+        assert not (tmp_path / "hashes.json").exists()
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])